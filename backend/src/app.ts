@@ -1,5 +1,6 @@
 import { Hono } from 'hono';
 import { logger } from 'hono/logger';
+import { config } from './config';
 import { corsMiddleware } from './middleware/cors';
 import health from './routes/health';
 import auth from './routes/auth';
@@ -17,7 +18,10 @@ import frontendRoute from './routes/frontend';
 const app = new Hono();
 
 // Global middleware
-app.use('*', logger());
+// Request logging is noise in the e2e suite, which fires thousands of requests
+if (config.env !== 'test') {
+  app.use('*', logger());
+}
 app.use('*', corsMiddleware);
 
 // API routes
@@ -9,15 +9,42 @@ function env(key: string, fallback?: string): string {
   return value;
 }
 
-export const config = {
+/**
+ * bcrypt work factor from BCRYPT_COST. Validated here so a bad value stops
+ * startup instead of making every hashPassword call throw at request time.
+ */
+function bcryptCost(): number {
+  const raw = env('BCRYPT_COST', '10');
+  const cost = Number(raw);
+  if (!Number.isInteger(cost) || cost < 4 || cost > 31) {
+    throw new Error(`Invalid BCRYPT_COST: ${raw} (expected an integer from 4 to 31)`);
+  }
+  return cost;
+}
+
+/** Freeze an object and every nested object, so config is read-only at runtime too. */
+function deepFreeze<T extends object>(obj: T): T {
+  for (const value of Object.values(obj)) {
+    if (typeof value === 'object' && value !== null) deepFreeze(value);
+  }
+  return Object.freeze(obj);
+}
+
+export const config = deepFreeze({
   env: env('ENV', 'production'),
   port: parseInt(env('PORT', '8000')),
   apiKey: env('API_KEY', 'dev-api-key'),
+  // `||`, not env(): an empty FRONTEND_URL= must still fall back, or reset
+  // emails would carry relative links.
+  frontendUrl: process.env.FRONTEND_URL || 'http://localhost:3000',
   jwt: {
     secret: env('JWT_SECRET_KEY', 'dev-secret-change-in-production'),
     expireMinutes: 30 * 24 * 60, // 30 days
     algorithm: 'HS256' as const,
   },
+  password: {
+    bcryptCost: bcryptCost(),
+  },
   database: {
     path: env('DATABASE_PATH', './data/budget.db'),
   },
@@ -35,6 +62,6 @@ export const config = {
     codeExpirationMinutes: parseInt(env('RESET_CODE_EXPIRATION_MINUTES', '30')),
     tokenExpirationHours: parseInt(env('RESET_TOKEN_EXPIRATION_HOURS', '24')),
   },
-} as const;
+} as const);
 
 export const isDev = config.env === 'development';
@@ -1,21 +1,22 @@
 import { drizzle, type BunSQLiteDatabase } from 'drizzle-orm/bun-sqlite';
-import { migrate } from 'drizzle-orm/bun-sqlite/migrator';
 import { Database } from 'bun:sqlite';
 import crypto from 'node:crypto';
 import fs from 'node:fs';
 import * as path from 'node:path';
 import * as schema from './schema';
+import { applyMigrations, migrationsFolder } from './migrate';
 
 const dbPath = process.env.DATABASE_PATH || './data/budget.db';
+// Optional override of SQLite's synchronous mode; unset keeps SQLite's FULL
+// default. Tests set OFF since the DB is thrown away.
+const synchronousModes = ['OFF', 'NORMAL', 'FULL', 'EXTRA'];
+const synchronous = process.env.SQLITE_SYNCHRONOUS?.toUpperCase();
+if (synchronous && !synchronousModes.includes(synchronous)) {
+  throw new Error(`Invalid SQLITE_SYNCHRONOUS: ${synchronous}`);
+}
 
 let sqlite = new Database(dbPath);
-// busy_timeout must come before journal_mode: switching to WAL needs an
-// exclusive lock, and after a close/reopen the outgoing handle may still
-// hold a shared lock briefly. This uses SQLite's own wait-and-retry loop
-// instead of an arbitrary sleep.
-sqlite.exec('PRAGMA busy_timeout = 5000');
-sqlite.exec('PRAGMA journal_mode = WAL');
-sqlite.exec('PRAGMA foreign_keys = ON');
+applyPragmas(sqlite);
 
 let db: BunSQLiteDatabase<typeof schema> = drizzle(sqlite, { schema });
 
@@ -32,11 +33,29 @@ const initialMigrationTables = [
 ];
 
 // Run migrations at startup
-const migrationsFolder = path.resolve(import.meta.dir, '../../drizzle');
 seedExistingDb(sqlite);
-migrate(db, { migrationsFolder });
+applyMigrations(sqlite);
 console.log('[db] Migrations applied successfully');
 
+/**
+ * Connection-level settings, applied on every open (startup and restore).
+ */
+function applyPragmas(sqliteDb: Database): void {
+  // busy_timeout must come before journal_mode: switching to WAL needs an
+  // exclusive lock, and after a close/reopen the outgoing handle may still
+  // hold a shared lock briefly. This uses SQLite's own wait-and-retry loop
+  // instead of an arbitrary sleep.
+  sqliteDb.exec('PRAGMA busy_timeout = 5000');
+  sqliteDb.exec('PRAGMA journal_mode = WAL');
+  if (synchronous) {
+    sqliteDb.exec(`PRAGMA synchronous = ${synchronous}`);
+  }
+  // Sorts and temp indices for ORDER BY / GROUP BY stay in RAM; the data set
+  // is far too small for this to matter for memory.
+  sqliteDb.exec('PRAGMA temp_store = MEMORY');
+  sqliteDb.exec('PRAGMA foreign_keys = ON');
+}
+
 /**
  * For databases created before Drizzle migrations were added:
  * Create the journal table and mark all existing migrations as applied
@@ -89,12 +108,10 @@ function seedExistingDb(sqliteDb: Database): void {
  */
 function resetConnection(): Database {
   sqlite = new Database(dbPath);
-  sqlite.exec('PRAGMA busy_timeout = 5000');
-  sqlite.exec('PRAGMA journal_mode = WAL');
-  sqlite.exec('PRAGMA foreign_keys = ON');
+  applyPragmas(sqlite);
   db = drizzle(sqlite, { schema });
   seedExistingDb(sqlite);
-  migrate(db, { migrationsFolder });
+  applyMigrations(sqlite);
   return sqlite;
 }
 
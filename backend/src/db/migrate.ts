@@ -0,0 +1,20 @@
+/**
+ * Drizzle migration runner.
+ *
+ * Shared by the backend's startup/restore path and the e2e preload, which
+ * builds the test schema with it, so both apply migrations the same way.
+ */
+
+import { drizzle } from 'drizzle-orm/bun-sqlite';
+import { migrate } from 'drizzle-orm/bun-sqlite/migrator';
+import type { Database } from 'bun:sqlite';
+import * as path from 'node:path';
+
+const migrationsFolder = path.resolve(import.meta.dir, '../../drizzle');
+
+/** Apply every pending migration and record it in __drizzle_migrations. */
+function applyMigrations(sqliteDb: Database): void {
+  migrate(drizzle(sqliteDb), { migrationsFolder });
+}
+
+export { migrationsFolder, applyMigrations };
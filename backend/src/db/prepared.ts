@@ -0,0 +1,41 @@
+/**
+ * Per-connection cache of Drizzle prepared statements.
+ *
+ * Building a query and compiling its SQL on every call is pure overhead for
+ * lookups that differ only in their parameters. Hot paths prepare them once
+ * with sql.placeholder() and execute the cached statement instead.
+ *
+ * A backup restore replaces the connection, so the cache is dropped whenever
+ * the live `db` changes, and explicitly before the old connection is closed.
+ */
+
+import { db } from './connection';
+
+type Database = typeof db;
+
+const statements = new Map<string, unknown>();
+let owner: Database | undefined;
+
+function prepared<T>(key: string, build: (database: Database) => T): T {
+  if (owner !== db) {
+    statements.clear();
+    owner = db;
+  }
+
+  let statement = statements.get(key) as T | undefined;
+  if (statement === undefined) {
+    statement = build(db);
+    statements.set(key, statement);
+  }
+  return statement;
+}
+
+/**
+ * Release every cached statement so the connection can be closed.
+ */
+function clearPreparedStatements(): void {
+  statements.clear();
+  owner = undefined;
+}
+
+export { prepared, clearPreparedStatements };
@@ -73,7 +73,7 @@ auth.post(
 
     // Check if user already exists
     const [existing] = await db
-      .select()
+      .select({ id: users.id })
       .from(users)
       .where(eq(users.email, body.email))
       .limit(1);
@@ -184,8 +184,7 @@ auth.post(
       });
 
       // Build reset URL
-      const frontendUrl = process.env.FRONTEND_URL || 'http://localhost:3000';
-      const resetUrl = `${frontendUrl}/reset-password?token=${token}`;
+      const resetUrl = `${config.frontendUrl}/reset-password?token=${token}`;
 
       // Log reset code
       console.warn(
@@ -384,7 +383,7 @@ auth.post(
 
     // Check if user already exists
     const [existing] = await db
-      .select()
+      .select({ id: users.id })
       .from(users)
       .where(eq(users.email, body.email))
       .limit(1);
@@ -452,7 +451,7 @@ auth.put(
     // Check email uniqueness if email is being changed
     if (body.email && body.email !== user.email) {
       const [existing] = await db
-        .select()
+        .select({ id: users.id })
         .from(users)
         .where(eq(users.email, body.email))
         .limit(1);
@@ -584,8 +583,7 @@ auth.post(
       created_at: now(),
     });
 
-    const frontendUrl = process.env.FRONTEND_URL || 'http://localhost:3000';
-    const resetUrl = `${frontendUrl}/reset-password?token=${token}`;
+    const resetUrl = `${config.frontendUrl}/reset-password?token=${token}`;
 
     console.info(`Admin generated reset link for user: ${user.email}`);
 
@@ -108,7 +108,7 @@ categoriesRoute.post(
 
     // Check if category already exists
     const [existing] = await db
-      .select()
+      .select({ id: categories.id })
       .from(categories)
       .where(eq(categories.name, body.name))
       .limit(1);
@@ -158,7 +158,7 @@ categoriesRoute.put(
 
     // Check if new name already exists (excluding current category)
     const [conflict] = await db
-      .select()
+      .select({ id: categories.id })
       .from(categories)
       .where(and(eq(categories.name, body.name), ne(categories.id, id)))
       .limit(1);
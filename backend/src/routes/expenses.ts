@@ -315,30 +315,21 @@ expensesRoute.post(
       }
     }
 
-    // Update order sequentially
+    // Update order sequentially; RETURNING hands back each updated row, so
+    // the response needs no second pass of SELECTs.
     const timestamp = now();
+    const result: Array<ReturnType<typeof serializeExpense>> = [];
     for (let order = 0; order < expense_ids.length; order++) {
       const updateFields: Record<string, unknown> = { order, updated_at: timestamp };
       if (userName) {
         updateFields.updated_by = userName;
       }
-      await db
+      const [exp] = await db
         .update(expenses)
         .set(updateFields)
-        .where(eq(expenses.id, expense_ids[order]));
-    }
-
-    // Return updated expenses in order
-    const result: Array<ReturnType<typeof serializeExpense>> = [];
-    for (const expenseId of expense_ids) {
-      const [exp] = await db
-        .select()
-        .from(expenses)
-        .where(eq(expenses.id, expenseId))
-        .limit(1);
-      if (exp) {
-        result.push(serializeExpense(exp));
-      }
+        .where(eq(expenses.id, expense_ids[order]))
+        .returning();
+      result.push(serializeExpense(exp));
     }
 
     return c.json(result);
@@ -8,7 +8,7 @@ import { Hono } from 'hono';
 import type { Context } from 'hono';
 import { serveStatic } from 'hono/bun';
 import { injectApiKey } from '../utils/html-injector';
-import { existsSync, readFileSync } from 'fs';
+import { existsSync, statSync } from 'fs';
 import { join } from 'path';
 
 const frontendRoute = new Hono();
@@ -16,21 +16,28 @@ const frontendRoute = new Hono();
 const backendRoot = join(import.meta.dir, '../..');
 const publicDir = join(import.meta.dir, '../../public');
 
+// Injected index.html, reused until the file on disk changes.
+let indexCache: { mtimeMs: number; html: string } | undefined;
+
 /**
  * Serve index.html with API key injected into the HTML.
  * Used for both / and catch-all SPA routing.
  */
 async function serveIndexHtml(c: Context) {
   const indexPath = join(publicDir, 'index.html');
+  const stats = statSync(indexPath, { throwIfNoEntry: false });
 
-  if (!existsSync(indexPath)) {
+  if (!stats) {
     return c.json({ detail: 'Frontend not built. Run the frontend build first.' }, 404);
   }
 
-  const html = readFileSync(indexPath, 'utf-8');
-  const injected = injectApiKey(html);
+  if (indexCache?.mtimeMs !== stats.mtimeMs) {
+    // Bun.file reads straight from the OS without blocking the event loop.
+    const html = await Bun.file(indexPath).text();
+    indexCache = { mtimeMs: stats.mtimeMs, html: injectApiKey(html) };
+  }
 
-  return c.html(injected);
+  return c.html(indexCache.html);
 }
 
 // Serve static assets (JS, CSS, images, etc.) from public/
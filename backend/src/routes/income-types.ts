@@ -103,7 +103,7 @@ incomeTypesRoute.post(
 
     // Check if income type already exists
     const [existing] = await db
-      .select()
+      .select({ id: incomeTypes.id })
       .from(incomeTypes)
       .where(eq(incomeTypes.name, body.name))
       .limit(1);
@@ -153,7 +153,7 @@ incomeTypesRoute.put(
 
     // Check if new name already exists (excluding current income type)
     const [conflict] = await db
-      .select()
+      .select({ id: incomeTypes.id })
       .from(incomeTypes)
       .where(and(eq(incomeTypes.name, body.name), ne(incomeTypes.id, id)))
       .limit(1);
@@ -5,10 +5,11 @@
  */
 
 import { Hono } from 'hono';
-import { eq, and, desc, asc } from 'drizzle-orm';
+import { eq, and, desc, asc, sql } from 'drizzle-orm';
 import { zValidator } from '@hono/zod-validator';
 
 import { db } from '../db/connection';
+import { prepared } from '../db/prepared';
 import { months, expenses, incomes } from '../db/schema';
 import { apiKeyAuth } from '../middleware/api-key';
 import { optionalAuth } from '../middleware/jwt';
@@ -42,6 +43,73 @@ function getMonthDates(year: number, month: number): { startDate: string; endDat
   return { startDate, endDate };
 }
 
+// Lookups below run on almost every month request; they are prepared once
+// per connection and reused with new parameters.
+function monthByIdQuery() {
+  return prepared('months.byId', (database) =>
+    database
+      .select()
+      .from(months)
+      .where(eq(months.id, sql.placeholder('id')))
+      .limit(1)
+      .prepare(),
+  );
+}
+
+// Existence checks only need the primary key, not the whole row.
+function monthIdQuery() {
+  return prepared('months.idById', (database) =>
+    database
+      .select({ id: months.id })
+      .from(months)
+      .where(eq(months.id, sql.placeholder('id')))
+      .limit(1)
+      .prepare(),
+  );
+}
+
+function monthIdByYearMonthQuery() {
+  return prepared('months.idByYearMonth', (database) =>
+    database
+      .select({ id: months.id })
+      .from(months)
+      .where(
+        and(eq(months.year, sql.placeholder('year')), eq(months.month, sql.placeholder('month'))),
+      )
+      .limit(1)
+      .prepare(),
+  );
+}
+
+function monthByYearMonthQuery() {
+  return prepared('months.byYearMonth', (database) =>
+    database
+      .select()
+      .from(months)
+      .where(
+        and(eq(months.year, sql.placeholder('year')), eq(months.month, sql.placeholder('month'))),
+      )
+      .limit(1)
+      .prepare(),
+  );
+}
+
+async function findMonthById(id: number) {
+  return monthByIdQuery().get({ id });
+}
+
+async function monthIdExists(id: number): Promise<boolean> {
+  return monthIdQuery().get({ id }) !== undefined;
+}
+
+async function yearMonthExists(year: number, month: number): Promise<boolean> {
+  return monthIdByYearMonthQuery().get({ year, month }) !== undefined;
+}
+
+async function findMonthByYearMonth(year: number, month: number) {
+  return monthByYearMonthQuery().get({ year, month });
+}
+
 // ─── GET /api/v1/months ─────────────────────────────────────────────────────
 
 monthsRoute.get('/api/v1/months', apiKeyAuth, optionalAuth, async (c) => {
@@ -61,11 +129,7 @@ monthsRoute.get('/api/v1/months/current', apiKeyAuth, optionalAuth, async (c) =>
   const currentMonth = today.getMonth() + 1;
 
   // Try to find the current month
-  const [month] = await db
-    .select()
-    .from(months)
-    .where(and(eq(months.year, currentYear), eq(months.month, currentMonth)))
-    .limit(1);
+  const month = await findMonthByYearMonth(currentYear, currentMonth);
 
   if (month) {
     return c.json(month);
@@ -91,11 +155,7 @@ monthsRoute.get('/api/v1/months/year/:year/month/:month', apiKeyAuth, optionalAu
   const year = parseInt(c.req.param('year'), 10);
   const monthNum = parseInt(c.req.param('month'), 10);
 
-  const [month] = await db
-    .select()
-    .from(months)
-    .where(and(eq(months.year, year), eq(months.month, monthNum)))
-    .limit(1);
+  const month = await findMonthByYearMonth(year, monthNum);
 
   if (!month) {
     return c.json({ detail: `Month ${year}-${String(monthNum).padStart(2, '0')} not found` }, 404);
@@ -109,11 +169,7 @@ monthsRoute.get('/api/v1/months/year/:year/month/:month', apiKeyAuth, optionalAu
 monthsRoute.get('/api/v1/months/:id', apiKeyAuth, optionalAuth, async (c) => {
   const id = parseInt(c.req.param('id'), 10);
 
-  const [month] = await db
-    .select()
-    .from(months)
-    .where(eq(months.id, id))
-    .limit(1);
+  const month = await findMonthById(id);
 
   if (!month) {
     return c.json({ detail: `Month with ID ${id} not found` }, 404);
@@ -134,13 +190,7 @@ monthsRoute.post(
     const userName = c.get('userName') as string | undefined;
 
     // Check if month already exists for this year+month combo
-    const [existing] = await db
-      .select()
-      .from(months)
-      .where(and(eq(months.year, body.year), eq(months.month, body.month)))
-      .limit(1);
-
-    if (existing) {
+    if (await yearMonthExists(body.year, body.month)) {
       return c.json(
         { detail: `Month ${generateMonthName(body.year, body.month)} already exists` },
         409,
@@ -183,11 +233,7 @@ monthsRoute.put(
     const body = c.req.valid('json');
     const userName = c.get('userName') as string | undefined;
 
-    const [month] = await db
-      .select()
-      .from(months)
-      .where(eq(months.id, id))
-      .limit(1);
+    const month = await findMonthById(id);
 
     if (!month) {
       return c.json({ detail: `Month with ID ${id} not found` }, 404);
@@ -205,13 +251,7 @@ monthsRoute.put(
 
       // Check if new year+month combo already exists (and is different from current)
       if (year !== month.year || monthNum !== month.month) {
-        const [existing] = await db
-          .select()
-          .from(months)
-          .where(and(eq(months.year, year), eq(months.month, monthNum)))
-          .limit(1);
-
-        if (existing) {
+        if (await yearMonthExists(year, monthNum)) {
           return c.json(
             { detail: `Month ${generateMonthName(year, monthNum)} already exists` },
             409,
@@ -249,13 +289,7 @@ monthsRoute.put(
 monthsRoute.delete('/api/v1/months/:id', apiKeyAuth, optionalAuth, async (c) => {
   const id = parseInt(c.req.param('id'), 10);
 
-  const [month] = await db
-    .select()
-    .from(months)
-    .where(eq(months.id, id))
-    .limit(1);
-
-  if (!month) {
+  if (!(await monthIdExists(id))) {
     return c.json({ detail: `Month with ID ${id} not found` }, 404);
   }
 
@@ -277,11 +311,7 @@ monthsRoute.post('/api/v1/months/:id/close', apiKeyAuth, optionalAuth, async (c)
   const id = parseInt(c.req.param('id'), 10);
   const userName = c.get('userName') as string | undefined;
 
-  const [month] = await db
-    .select()
-    .from(months)
-    .where(eq(months.id, id))
-    .limit(1);
+  const month = await findMonthById(id);
 
   if (!month) {
     return c.json({ detail: `Month with ID ${id} not found` }, 404);
@@ -313,11 +343,7 @@ monthsRoute.post('/api/v1/months/:id/open', apiKeyAuth, optionalAuth, async (c)
   const id = parseInt(c.req.param('id'), 10);
   const userName = c.get('userName') as string | undefined;
 
-  const [month] = await db
-    .select()
-    .from(months)
-    .where(eq(months.id, id))
-    .limit(1);
+  const month = await findMonthById(id);
 
   if (!month) {
     return c.json({ detail: `Month with ID ${id} not found` }, 404);
@@ -350,11 +376,7 @@ monthsRoute.post('/api/v1/months/:id/clone', apiKeyAuth, optionalAuth, async (c)
   const userName = c.get('userName') as string | undefined;
 
   // Get the source month
-  const [sourceMonth] = await db
-    .select()
-    .from(months)
-    .where(eq(months.id, id))
-    .limit(1);
+  const sourceMonth = await findMonthById(id);
 
   if (!sourceMonth) {
     return c.json({ detail: `Month with ID ${id} not found` }, 404);
@@ -369,11 +391,7 @@ monthsRoute.post('/api/v1/months/:id/clone', apiKeyAuth, optionalAuth, async (c)
   }
 
   // Get or create the next month
-  let [nextMonth] = await db
-    .select()
-    .from(months)
-    .where(and(eq(months.year, nextYear), eq(months.month, nextMonthNum)))
-    .limit(1);
+  let nextMonth = await findMonthByYearMonth(nextYear, nextMonthNum);
 
   if (!nextMonth) {
     const nextName = generateMonthName(nextYear, nextMonthNum);
@@ -404,27 +422,30 @@ monthsRoute.post('/api/v1/months/:id/clone', apiKeyAuth, optionalAuth, async (c)
     .where(eq(expenses.month_id, id))
     .orderBy(asc(expenses.order), asc(expenses.expense_name));
 
-  let clonedCount = 0;
+  // Insert each table's clones as one multi-row INSERT rather than one
+  // statement per row.
   const timestamp = now();
-  for (const expense of sourceExpenses) {
-    await db.insert(expenses).values({
-      expense_name: expense.expense_name,
-      period: expense.period,
-      category: expense.category,
-      budget: expense.budget,
-      cost: 0,
-      notes: expense.notes,
-      month_id: nextMonth.id,
-      purchases: null,
-      order: expense.order,
-      expense_date: null,
-      created_at: timestamp,
-      updated_at: timestamp,
-      created_by: userName ?? null,
-      updated_by: userName ?? null,
-    });
-    clonedCount += 1;
+  if (sourceExpenses.length > 0) {
+    await db.insert(expenses).values(
+      sourceExpenses.map((expense) => ({
+        expense_name: expense.expense_name,
+        period: expense.period,
+        category: expense.category,
+        budget: expense.budget,
+        cost: 0,
+        notes: expense.notes,
+        month_id: nextMonth.id,
+        purchases: null,
+        order: expense.order,
+        expense_date: null,
+        created_at: timestamp,
+        updated_at: timestamp,
+        created_by: userName ?? null,
+        updated_by: userName ?? null,
+      })),
+    );
   }
+  const clonedCount = sourceExpenses.length;
 
   // Clone incomes from source month
   const sourceIncomes = await db
@@ -432,21 +453,22 @@ monthsRoute.post('/api/v1/months/:id/clone', apiKeyAuth, optionalAuth, async (c)
     .from(incomes)
     .where(eq(incomes.month_id, id));
 
-  let clonedIncomeCount = 0;
-  for (const income of sourceIncomes) {
-    await db.insert(incomes).values({
-      income_type_id: income.income_type_id,
-      period: income.period,
-      budget: income.budget,
-      amount: 0,
-      month_id: nextMonth.id,
-      created_at: timestamp,
-      updated_at: timestamp,
-      created_by: userName ?? null,
-      updated_by: userName ?? null,
-    });
-    clonedIncomeCount += 1;
+  if (sourceIncomes.length > 0) {
+    await db.insert(incomes).values(
+      sourceIncomes.map((income) => ({
+        income_type_id: income.income_type_id,
+        period: income.period,
+        budget: income.budget,
+        amount: 0,
+        month_id: nextMonth.id,
+        created_at: timestamp,
+        updated_at: timestamp,
+        created_by: userName ?? null,
+        updated_by: userName ?? null,
+      })),
+    );
   }
+  const clonedIncomeCount = sourceIncomes.length;
 
   // Build success message
   const parts: string[] = [];
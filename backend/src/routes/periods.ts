@@ -9,6 +9,7 @@ import { eq, ne, and, sql } from 'drizzle-orm';
 import { zValidator } from '@hono/zod-validator';
 
 import { db } from '../db/connection';
+import { prepared } from '../db/prepared';
 import { periods, expenses, incomes } from '../db/schema';
 import { apiKeyAuth } from '../middleware/api-key';
 import { optionalAuth } from '../middleware/jwt';
@@ -25,6 +26,56 @@ function now(): string {
   return new Date().toISOString();
 }
 
+// Period lookups are prepared once per connection and reused with new
+// parameters (see db/prepared.ts).
+function periodByIdQuery() {
+  return prepared('periods.byId', (database) =>
+    database
+      .select()
+      .from(periods)
+      .where(eq(periods.id, sql.placeholder('id')))
+      .limit(1)
+      .prepare(),
+  );
+}
+
+function periodIdByNameQuery() {
+  return prepared('periods.idByName', (database) =>
+    database
+      .select({ id: periods.id })
+      .from(periods)
+      .where(eq(periods.name, sql.placeholder('name')))
+      .limit(1)
+      .prepare(),
+  );
+}
+
+function otherPeriodIdByNameQuery() {
+  return prepared('periods.otherIdByName', (database) =>
+    database
+      .select({ id: periods.id })
+      .from(periods)
+      .where(
+        and(eq(periods.name, sql.placeholder('name')), ne(periods.id, sql.placeholder('id'))),
+      )
+      .limit(1)
+      .prepare(),
+  );
+}
+
+async function findPeriodById(id: number) {
+  return periodByIdQuery().get({ id });
+}
+
+async function periodNameExists(name: string): Promise<boolean> {
+  return periodIdByNameQuery().get({ name }) !== undefined;
+}
+
+/** Whether a period other than `id` already uses `name`. */
+async function periodNameTaken(name: string, id: number): Promise<boolean> {
+  return otherPeriodIdByNameQuery().get({ name, id }) !== undefined;
+}
+
 // ─── GET /api/v1/periods ────────────────────────────────────────────────────
 
 periodsRoute.get('/api/v1/periods', apiKeyAuth, optionalAuth, async (c) => {
@@ -37,11 +88,7 @@ periodsRoute.get('/api/v1/periods', apiKeyAuth, optionalAuth, async (c) => {
 periodsRoute.get('/api/v1/periods/:id', apiKeyAuth, optionalAuth, async (c) => {
   const id = parseInt(c.req.param('id'), 10);
 
-  const [period] = await db
-    .select()
-    .from(periods)
-    .where(eq(periods.id, id))
-    .limit(1);
+  const period = await findPeriodById(id);
 
   if (!period) {
     return c.json({ detail: 'Period not found' }, 404);
@@ -62,13 +109,7 @@ periodsRoute.post(
     const userName = c.get('userName') as string | undefined;
 
     // Check if period already exists
-    const [existing] = await db
-      .select()
-      .from(periods)
-      .where(eq(periods.name, body.name))
-      .limit(1);
-
-    if (existing) {
+    if (await periodNameExists(body.name)) {
       return c.json({ detail: 'Period already exists' }, 400);
     }
 
@@ -101,24 +142,14 @@ periodsRoute.put(
     const body = c.req.valid('json');
     const userName = c.get('userName') as string | undefined;
 
-    const [period] = await db
-      .select()
-      .from(periods)
-      .where(eq(periods.id, id))
-      .limit(1);
+    const period = await findPeriodById(id);
 
     if (!period) {
       return c.json({ detail: 'Period not found' }, 404);
     }
 
     // Check if new name already exists (excluding current period)
-    const [conflict] = await db
-      .select()
-      .from(periods)
-      .where(and(eq(periods.name, body.name), ne(periods.id, id)))
-      .limit(1);
-
-    if (conflict) {
+    if (await periodNameTaken(body.name, id)) {
       return c.json({ detail: 'Period name already exists' }, 400);
     }
 
@@ -160,11 +191,7 @@ periodsRoute.delete(
   async (c) => {
     const id = parseInt(c.req.param('id'), 10);
 
-    const [period] = await db
-      .select()
-      .from(periods)
-      .where(eq(periods.id, id))
-      .limit(1);
+    const period = await findPeriodById(id);
 
     if (!period) {
       return c.json({ detail: 'Period not found' }, 404);
@@ -5,7 +5,7 @@
  */
 
 import { Hono } from 'hono';
-import { eq, and, desc } from 'drizzle-orm';
+import { eq, and, desc, inArray, sql } from 'drizzle-orm';
 
 import { db } from '../db/connection';
 import { expenses, incomes, periods, months, categories } from '../db/schema';
@@ -39,25 +39,27 @@ summaryRoute.get('/api/v1/summary/totals', apiKeyAuth, optionalAuth, async (c) =
     incomeConditions.push(eq(incomes.period, period));
   }
 
-  // Fetch expenses
-  const expenseQuery = db.select().from(expenses);
-  const expenseRows =
-    expenseConditions.length > 0
-      ? await expenseQuery.where(and(...expenseConditions))
-      : await expenseQuery;
-
-  // Fetch incomes
-  const incomeQuery = db.select().from(incomes);
-  const incomeRows =
-    incomeConditions.length > 0
-      ? await incomeQuery.where(and(...incomeConditions))
-      : await incomeQuery;
-
-  // Calculate totals
-  const total_budget_expenses = expenseRows.reduce((sum, e) => sum + (e.budget ?? 0), 0);
-  const total_current_expenses = expenseRows.reduce((sum, e) => sum + (e.cost ?? 0), 0);
-  const total_budget_income = incomeRows.reduce((sum, i) => sum + (i.budget ?? 0), 0);
-  const total_current_income = incomeRows.reduce((sum, i) => sum + (i.amount ?? 0), 0);
+  // Let SQLite add up the filtered rows instead of loading them all
+  const [expenseTotals] = await db
+    .select({
+      budget: sql<number>`coalesce(sum(${expenses.budget}), 0)`,
+      cost: sql<number>`coalesce(sum(${expenses.cost}), 0)`,
+    })
+    .from(expenses)
+    .where(and(...expenseConditions));
+
+  const [incomeTotals] = await db
+    .select({
+      budget: sql<number>`coalesce(sum(${incomes.budget}), 0)`,
+      amount: sql<number>`coalesce(sum(${incomes.amount}), 0)`,
+    })
+    .from(incomes)
+    .where(and(...incomeConditions));
+
+  const total_budget_expenses = expenseTotals.budget;
+  const total_current_expenses = expenseTotals.cost;
+  const total_budget_income = incomeTotals.budget;
+  const total_current_income = incomeTotals.amount;
 
   return c.json({
     total_budget_expenses,
@@ -75,34 +77,40 @@ summaryRoute.get('/api/v1/summary/by-period', apiKeyAuth, optionalAuth, async (c
   const monthIdParam = c.req.query('month_id');
   const monthId = monthIdParam ? parseInt(monthIdParam, 10) : undefined;
 
-  // Get all periods
+  // One grouped query per table rather than two queries per period
+  const expenseWhere = monthId !== undefined ? eq(expenses.month_id, monthId) : undefined;
+  const incomeWhere = monthId !== undefined ? eq(incomes.month_id, monthId) : undefined;
+
   const allPeriods = await db.select().from(periods);
 
+  const expenseTotals = await db
+    .select({
+      period: expenses.period,
+      total: sql<number>`coalesce(sum(${expenses.cost}), 0)`,
+    })
+    .from(expenses)
+    .where(expenseWhere)
+    .groupBy(expenses.period);
+
+  const incomeTotals = await db
+    .select({
+      period: incomes.period,
+      total: sql<number>`coalesce(sum(${incomes.amount}), 0)`,
+    })
+    .from(incomes)
+    .where(incomeWhere)
+    .groupBy(incomes.period);
+
+  const expensesByPeriod = new Map(expenseTotals.map((row) => [row.period, row.total]));
+  const incomesByPeriod = new Map(incomeTotals.map((row) => [row.period, row.total]));
+
   const periodSummaries = [];
   let grand_total_income = 0;
   let grand_total_expenses = 0;
 
   for (const period of allPeriods) {
-    // Fetch expenses for this period
-    const expenseConditions = [eq(expenses.period, period.name)];
-    if (monthId !== undefined) expenseConditions.push(eq(expenses.month_id, monthId));
-
-    const periodExpenses = await db
-      .select()
-      .from(expenses)
-      .where(and(...expenseConditions));
-
-    // Fetch incomes for this period
-    const incomeConditions = [eq(incomes.period, period.name)];
-    if (monthId !== undefined) incomeConditions.push(eq(incomes.month_id, monthId));
-
-    const periodIncomes = await db
-      .select()
-      .from(incomes)
-      .where(and(...incomeConditions));
-
-    const total_income = periodIncomes.reduce((sum, i) => sum + (i.amount ?? 0), 0);
-    const total_expenses = periodExpenses.reduce((sum, e) => sum + (e.cost ?? 0), 0);
+    const total_income = incomesByPeriod.get(period.name) ?? 0;
+    const total_expenses = expensesByPeriod.get(period.name) ?? 0;
 
     periodSummaries.push({
       period: period.name,
@@ -130,31 +138,34 @@ summaryRoute.get('/api/v1/summary/expenses-by-period', apiKeyAuth, optionalAuth,
   const monthIdParam = c.req.query('month_id');
   const monthId = monthIdParam ? parseInt(monthIdParam, 10) : undefined;
 
-  // Get all periods
-  const allPeriods = await db.select().from(periods);
-
-  const periodSummaries = [];
+  // One grouped query rather than one query per period
+  const expenseWhere = monthId !== undefined ? eq(expenses.month_id, monthId) : undefined;
 
-  for (const period of allPeriods) {
-    const conditions = [eq(expenses.period, period.name)];
-    if (monthId !== undefined) conditions.push(eq(expenses.month_id, monthId));
+  const allPeriods = await db.select().from(periods);
 
-    const periodExpenses = await db
-      .select()
-      .from(expenses)
-      .where(and(...conditions));
+  const totals = await db
+    .select({
+      period: expenses.period,
+      budget: sql<number>`coalesce(sum(${expenses.budget}), 0)`,
+      total: sql<number>`coalesce(sum(${expenses.cost}), 0)`,
+    })
+    .from(expenses)
+    .where(expenseWhere)
+    .groupBy(expenses.period);
 
-    const budget = periodExpenses.reduce((sum, e) => sum + (e.budget ?? 0), 0);
-    const total = periodExpenses.reduce((sum, e) => sum + (e.cost ?? 0), 0);
+  const totalsByPeriod = new Map(totals.map((row) => [row.period, row]));
 
-    periodSummaries.push({
+  const periodSummaries = allPeriods.map((period) => {
+    const budget = totalsByPeriod.get(period.name)?.budget ?? 0;
+    const total = totalsByPeriod.get(period.name)?.total ?? 0;
+    return {
       period: period.name,
       color: period.color,
       budget,
       total,
       over_budget: total > budget,
-    });
-  }
+    };
+  });
 
   return c.json(periodSummaries);
 });
@@ -177,6 +188,10 @@ summaryRoute.get('/api/v1/summary/monthly-trends', apiKeyAuth, optionalAuth, asy
 
   const selectedMonths = allMonths.slice(0, numMonths).reverse();
 
+  if (selectedMonths.length === 0) {
+    return c.json({ months: [], average_income: 0, average_expenses: 0, average_savings_rate: 0 });
+  }
+
   // Get all categories for color lookup
   const allCategories = await db.select().from(categories);
   const categoryColors: Record<string, string> = {};
@@ -190,17 +205,23 @@ summaryRoute.get('/api/v1/summary/monthly-trends', apiKeyAuth, optionalAuth, asy
   let totalSavingsRate = 0;
   let monthsWithIncome = 0;
 
-  for (const month of selectedMonths) {
-    // Fetch expenses and incomes for this month
-    const monthExpenses = await db
-      .select()
-      .from(expenses)
-      .where(eq(expenses.month_id, month.id));
+  // Fetch the selected months' rows in one query per table, then bucket them
+  const selectedIds = selectedMonths.map((m) => m.id);
+  const trendExpenses = await db
+    .select()
+    .from(expenses)
+    .where(inArray(expenses.month_id, selectedIds));
+  const trendIncomes = await db
+    .select()
+    .from(incomes)
+    .where(inArray(incomes.month_id, selectedIds));
 
-    const monthIncomes = await db
-      .select()
-      .from(incomes)
-      .where(eq(incomes.month_id, month.id));
+  const expensesByMonth = Map.groupBy(trendExpenses, (e) => e.month_id);
+  const incomesByMonth = Map.groupBy(trendIncomes, (i) => i.month_id);
+
+  for (const month of selectedMonths) {
+    const monthExpenses = expensesByMonth.get(month.id) ?? [];
+    const monthIncomes = incomesByMonth.get(month.id) ?? [];
 
     const monthIncome = monthIncomes.reduce((sum, i) => sum + (i.amount ?? 0), 0);
     const monthExpenseTotal = monthExpenses.reduce((sum, e) => sum + (e.cost ?? 0), 0);
@@ -18,6 +18,7 @@ import { join, basename, resolve } from 'node:path';
 import { Database } from 'bun:sqlite';
 import { config } from '../config';
 import { sqlite, resetConnection } from '../db/connection';
+import { clearPreparedStatements } from '../db/prepared';
 
 const BACKUP_DIR = resolve(config.database.path, '..', 'backups');
 
@@ -136,7 +137,9 @@ async function replaceDatabaseFile(sourcePath: string): Promise<void> {
   try {
     // Drizzle's prepared-statement wrappers are unreachable after each
     // query but not yet finalized; a synchronous GC finalizes them so
-    // close() actually releases the file handle.
+    // close() actually releases the file handle. Cached statements are
+    // dropped first so they become unreachable too.
+    clearPreparedStatements();
     Bun.gc(true);
     sqlite.close(true);
     removeSqliteSidecars(dbPath);
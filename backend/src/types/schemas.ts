@@ -92,7 +92,11 @@ export const expenseUpdateSchema = z.object({
 });
 
 export const expenseReorderSchema = z.object({
-  expense_ids: z.array(z.number().int().positive()),
+  expense_ids: z
+    .array(z.number().int().positive())
+    .refine((ids) => new Set(ids).size === ids.length, {
+      message: 'expense_ids must not contain duplicates',
+    }),
 });
 
 export const payExpenseSchema = z.object({
@@ -2,17 +2,31 @@
  * JWT and password utilities using jose and Bun.password.
  */
 
+import { randomInt } from 'node:crypto';
 import * as jose from 'jose';
 import { config } from '../config';
 
-const secret = new TextEncoder().encode(config.jwt.secret);
+// Imported once as a CryptoKey: given raw bytes, jose would re-import the
+// HMAC key on every sign and verify.
+const secret = crypto.subtle.importKey(
+  'raw',
+  new TextEncoder().encode(config.jwt.secret),
+  { name: 'HMAC', hash: 'SHA-256' },
+  false,
+  ['sign', 'verify'],
+);
+const protectedHeader = Object.freeze({ alg: config.jwt.algorithm });
 
+// Bun.password.hash/verify run on a worker thread, so the event loop stays
+// free while bcrypt works; BCRYPT_COST trades that work for strength.
 export async function hashPassword(password: string): Promise<string> {
-  return Bun.password.hash(password, { algorithm: 'bcrypt', cost: 10 });
+  return Bun.password.hash(password, { algorithm: 'bcrypt', cost: config.password.bcryptCost });
 }
 
 export async function verifyPassword(password: string, hash: string): Promise<boolean> {
-  return Bun.password.verify(password, hash);
+  // Every stored hash is bcrypt (ours and the Python backend's), so name the
+  // algorithm rather than have Bun sniff it from the hash prefix.
+  return Bun.password.verify(password, hash, 'bcrypt');
 }
 
 export async function createAccessToken(
@@ -20,18 +34,20 @@ export async function createAccessToken(
   expiresInMinutes?: number,
 ): Promise<string> {
   const minutes = expiresInMinutes ?? config.jwt.expireMinutes;
+  // Numeric claims: a '30m'-style string would be regex-parsed per token.
+  const issuedAt = Math.floor(Date.now() / 1000);
   return new jose.SignJWT(data)
-    .setProtectedHeader({ alg: config.jwt.algorithm })
-    .setExpirationTime(`${minutes}m`)
-    .setIssuedAt()
-    .sign(secret);
+    .setProtectedHeader(protectedHeader)
+    .setExpirationTime(issuedAt + minutes * 60)
+    .setIssuedAt(issuedAt)
+    .sign(await secret);
 }
 
 export async function decodeAccessToken(
   token: string,
 ): Promise<Record<string, unknown> | null> {
   try {
-    const { payload } = await jose.jwtVerify(token, secret);
+    const { payload } = await jose.jwtVerify(token, await secret);
     return payload as Record<string, unknown>;
   } catch {
     return null;
@@ -42,13 +58,18 @@ export function generateResetToken(): string {
   return crypto.randomUUID() + crypto.randomUUID();
 }
 
+// randomInt accepts ranges below 2^48, so at most 14 digits per draw.
+const MAX_DIGITS_PER_DRAW = 14;
+
+/**
+ * Uniform random numeric code of `length` digits. Short codes take a single
+ * draw; longer ones are built from chunks of up to 14 digits.
+ */
 export function generateShortCode(length = 6): string {
-  const digits = '0123456789';
   let code = '';
-  const array = new Uint8Array(length);
-  crypto.getRandomValues(array);
-  for (const byte of array) {
-    code += digits[byte % 10];
+  for (let remaining = length; remaining > 0; remaining -= MAX_DIGITS_PER_DRAW) {
+    const digits = Math.min(remaining, MAX_DIGITS_PER_DRAW);
+    code += String(randomInt(10 ** digits)).padStart(digits, '0');
   }
   return code;
 }
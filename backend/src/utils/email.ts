@@ -3,6 +3,7 @@
  * Ported from backend-python-archive/utils/email_sender.py.
  */
 
+import { createSecureContext } from 'node:tls';
 import nodemailer from 'nodemailer';
 import type Mail from 'nodemailer/lib/mailer';
 import { config } from '../config';
@@ -10,7 +11,11 @@ import { config } from '../config';
 function createTransport(): nodemailer.Transporter | null {
   if (!config.smtp.enabled) return null;
 
+  // Pooled: the TLS handshake and AUTH are paid once and the connection is
+  // reused (and transparently re-opened) for later sends.
   return nodemailer.createTransport({
+    pool: true,
+    maxConnections: 1,
     host: config.smtp.host,
     port: config.smtp.port,
     secure: config.smtp.port === 465,
@@ -20,42 +25,18 @@ function createTransport(): nodemailer.Transporter | null {
     ...(config.smtp.user && config.smtp.password
       ? { auth: { user: config.smtp.user, pass: config.smtp.password } }
       : {}),
+    // One TLS context (CA store parsed once) shared by every (re)connect.
+    tls: { secureContext: createSecureContext() },
     connectionTimeout: 10_000,
   });
 }
 
 const transporter = createTransport();
 
-export async function sendPasswordResetEmail(
-  toEmail: string,
-  resetUrl: string,
-  shortCode: string,
-  expiresMinutes: number,
-): Promise<boolean> {
-  if (!transporter) {
-    console.info('SMTP not configured, skipping email send');
-    return false;
-  }
-
-  const textContent = `
-Password Reset Request
+// ─── Password reset templates ───────────────────────────────────────────────
 
-You requested a password reset for your account.
-
-You can reset your password in two ways:
-
-1. Click this link:
-${resetUrl}
-
-2. Or use this code on the reset page:
-${shortCode}
-
-This code will expire in ${expiresMinutes} minutes.
-
-If you didn't request this, please ignore this email.
-`.trim();
-
-  const htmlContent = `<!DOCTYPE html>
+// The document head and stylesheet never change, so they are built once.
+const RESET_HTML_HEAD = `<!DOCTYPE html>
 <html>
 <head>
     <style>
@@ -112,7 +93,28 @@ If you didn't request this, please ignore this email.
         }
     </style>
 </head>
-<body>
+`;
+
+function renderResetText(resetUrl: string, shortCode: string, expiresMinutes: number): string {
+  return `Password Reset Request
+
+You requested a password reset for your account.
+
+You can reset your password in two ways:
+
+1. Click this link:
+${resetUrl}
+
+2. Or use this code on the reset page:
+${shortCode}
+
+This code will expire in ${expiresMinutes} minutes.
+
+If you didn't request this, please ignore this email.`;
+}
+
+function renderResetHtml(resetUrl: string, shortCode: string, expiresMinutes: number): string {
+  return `${RESET_HTML_HEAD}<body>
     <div class="container">
         <div class="header">
             <h1>Password Reset Request</h1>
@@ -140,6 +142,21 @@ If you didn't request this, please ignore this email.
     </div>
 </body>
 </html>`;
+}
+
+export async function sendPasswordResetEmail(
+  toEmail: string,
+  resetUrl: string,
+  shortCode: string,
+  expiresMinutes: number,
+): Promise<boolean> {
+  if (!transporter) {
+    console.info('SMTP not configured, skipping email send');
+    return false;
+  }
+
+  const textContent = renderResetText(resetUrl, shortCode, expiresMinutes);
+  const htmlContent = renderResetHtml(resetUrl, shortCode, expiresMinutes);
 
   const mailOptions: Mail.Options = {
     from: config.smtp.from,
@@ -4,8 +4,22 @@
 
 import { config } from '../config';
 
+// First of </head>, </body> or <body ...>, found in a single pass.
+const INJECTION_POINT = /<\/head\s*>|<\/body\s*>|<body(?:\s[^>]*)?>/i;
+
 export function injectApiKey(html: string, apiKey?: string): string {
   const key = apiKey ?? config.apiKey;
   const configScript = `<script>window.APP_CONFIG = ${JSON.stringify({ API_KEY: key })};</script>`;
-  return html.replace('</head>', `${configScript}\n</head>`);
+
+  const match = INJECTION_POINT.exec(html);
+  if (!match) {
+    return html;
+  }
+
+  // Closing tags get the script before them; an opening <body> gets it after.
+  if (match[0].startsWith('</')) {
+    return `${html.slice(0, match.index)}${configScript}\n${html.slice(match.index)}`;
+  }
+  const end = match.index + match[0].length;
+  return `${html.slice(0, end)}\n${configScript}${html.slice(end)}`;
 }
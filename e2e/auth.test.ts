@@ -1,6 +1,7 @@
-import { describe, test, expect, beforeAll, afterAll } from 'bun:test';
-import { getApp, startServer, stopServer } from './setup';
+import { describe, test, expect, beforeAll } from 'bun:test';
+import { getApp, startServer } from './setup';
 import { apiHeaders, registerUser, loginUser, registerAndGetToken, httpRegisterUser, httpLoginUser, httpRegisterAndGetToken } from './helpers';
+import { generateShortCode } from '../backend/src/utils/auth';
 import type { Hono } from 'hono';
 
 let app: Hono;
@@ -33,13 +34,11 @@ describe('Auth (Hono client)', () => {
     expect(data.email).toBe('hono@test.com');
   });
 
-  test('login with wrong password fails', async () => {
-    const res = await loginUser(app, 'hono@test.com', 'wrongpass');
-    expect(res.status).toBe(401);
-  });
-
-  test('login with non-existent user fails', async () => {
-    const res = await loginUser(app, 'nobody@test.com', 'pass123');
+  test.each([
+    ['wrong password', 'hono@test.com', 'wrongpass'],
+    ['non-existent user', 'nobody@test.com', 'pass123'],
+  ])('login with %s fails', async (_case, email, password) => {
+    const res = await loginUser(app, email, password);
     expect(res.status).toBe(401);
   });
 
@@ -106,10 +105,6 @@ describe('Auth (HTTP)', () => {
     baseUrl = await startServer();
   });
 
-  afterAll(async () => {
-    await stopServer();
-  });
-
   test('register and login via HTTP', async () => {
     const regRes = await httpRegisterUser(baseUrl, 'http@test.com', 'pass123', 'HTTP User');
     expect(regRes.status).toBe(201);
@@ -130,3 +125,10 @@ describe('Auth (HTTP)', () => {
     expect(data.email).toBe('httpme@test.com');
   });
 });
+
+describe('generateShortCode', () => {
+  // 14 digits is the most a single randomInt draw can cover.
+  test.each([6, 14, 15, 32])('returns %d digits', (length) => {
+    expect(generateShortCode(length)).toMatch(new RegExp(`^\\d{${length}}$`));
+  });
+});
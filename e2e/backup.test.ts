@@ -1,15 +1,13 @@
 import { describe, test, expect, beforeAll, afterAll } from 'bun:test';
-import { getApp, startServer, stopServer } from './setup';
+import { getApp, getSqlite, resetDatabase, startServer } from './setup';
 import {
   apiHeaders,
-  seedMonth,
-  seedPeriod,
-  seedCategory,
+  seedFixtures,
   seedExpense,
-  seedIncomeType,
   seedIncome,
   registerUser,
   loginUser,
+  uploadHeaders,
 } from './helpers';
 import type { Hono } from 'hono';
 import { Database } from 'bun:sqlite';
@@ -24,11 +22,8 @@ async function getAdminToken(app: Hono): Promise<string> {
   const password = 'adminpass123';
   await registerUser(app, email, password, 'Backup Admin');
 
-  // Set the user as admin directly in the test DB
-  const dbPath = process.env.DATABASE_PATH!;
-  const sqlite = new Database(dbPath);
-  sqlite.exec(`UPDATE users SET is_admin = 1 WHERE email = '${email}'`);
-  sqlite.close();
+  // Set the user as admin directly through the backend's connection
+  getSqlite().run('UPDATE users SET is_admin = 1 WHERE email = ?', [email]);
 
   const loginRes = await loginUser(app, email, password);
   const data = (await loginRes.json()) as { access_token: string };
@@ -51,10 +46,7 @@ beforeAll(async () => {
   app = await getApp();
   adminToken = await getAdminToken(app);
 
-  const period = await seedPeriod(app, 'Bak-Period');
-  const cat = await seedCategory(app, 'Bak-Category');
-  const it = await seedIncomeType(app, 'Bak-Salary');
-  const month = await seedMonth(app, 2023, 1);
+  const { period, category: cat, incomeType: it, month } = await seedFixtures(app, 'Bak', 2023, 1);
   await seedExpense(app, month.id, {
     expense_name: 'BakExp',
     period: period.name,
@@ -64,6 +56,11 @@ beforeAll(async () => {
   await seedIncome(app, month.id, { income_type_id: it.id, period: period.name, budget: 500 });
 });
 
+// Restores roll the whole DB back to a snapshot; hand the next file a clean one.
+afterAll(() => {
+  resetDatabase();
+});
+
 // ─── JSON backup (legacy /api/v1/backup) ────────────────────────────────────
 
 describe('JSON Backup (Hono client)', () => {
@@ -132,7 +129,7 @@ describe('SQLite Backups (Hono client)', () => {
       backup_dir: string;
     };
     expect(data.backups.length).toBeGreaterThan(0);
-    expect(data.backups.some((b) => b.filename === createdFilename)).toBe(true);
+    expect(data.backups.map((b) => b.filename)).toContain(createdFilename);
     expect(data.backup_dir).toBeTruthy();
   });
 
@@ -196,9 +193,8 @@ describe('SQLite Backups (Hono client)', () => {
     const formData = new FormData();
     formData.append('file', new File([bytes], 'uploaded-backup.db'));
 
-    const headers = apiHeaders(adminToken);
-    // Remove Content-Type so FormData sets its own boundary
-    delete headers['Content-Type'];
+    // FormData sets its own multipart Content-Type
+    const headers = uploadHeaders(adminToken);
 
     const res = await app.request('/api/v1/backups/upload-restore', {
       method: 'POST',
@@ -222,8 +218,7 @@ describe('SQLite Backups (Hono client)', () => {
     const formData = new FormData();
     formData.append('file', new File([corruptBytes], 'corrupt-backup.db'));
 
-    const headers = apiHeaders(adminToken);
-    delete headers['Content-Type'];
+    const headers = uploadHeaders(adminToken);
 
     const res = await app.request('/api/v1/backups/upload-restore', {
       method: 'POST',
@@ -254,8 +249,7 @@ describe('SQLite Backups (Hono client)', () => {
     const formData = new FormData();
     formData.append('file', new File([readFileSync(tempPath)], 'legacy-backup.db'));
     try {
-      const headers = apiHeaders(adminToken);
-      delete headers['Content-Type'];
+      const headers = uploadHeaders(adminToken);
 
       const res = await app.request('/api/v1/backups/upload-restore', {
         method: 'POST',
@@ -264,17 +258,11 @@ describe('SQLite Backups (Hono client)', () => {
       });
       expect(res.status).toBe(200);
 
-      const restoredDb = new Database(process.env.DATABASE_PATH!);
-      try {
-        const journal = restoredDb
-          .query(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name='__drizzle_migrations'",
-          )
-          .get();
-        expect(journal).toBeTruthy();
-      } finally {
-        restoredDb.close();
-      }
+      // The restore reopened the backend connection on the restored file
+      const journal = getSqlite()
+        .query("SELECT name FROM sqlite_master WHERE type='table' AND name='__drizzle_migrations'")
+        .get();
+      expect(journal).toBeTruthy();
     } finally {
       try {
         unlinkSync(tempPath);
@@ -288,8 +276,7 @@ describe('SQLite Backups (Hono client)', () => {
     const formData = new FormData();
     formData.append('file', new File(['not a db'], 'backup.txt'));
 
-    const headers = apiHeaders(adminToken);
-    delete headers['Content-Type'];
+    const headers = uploadHeaders(adminToken);
 
     const res = await app.request('/api/v1/backups/upload-restore', {
       method: 'POST',
@@ -322,7 +309,7 @@ describe('SQLite Backups (Hono client)', () => {
     const listData = (await listRes.json()) as {
       backups: Array<{ filename: string }>;
     };
-    expect(listData.backups.some((b) => b.filename === filename)).toBe(false);
+    expect(listData.backups.map((b) => b.filename)).not.toContain(filename);
   });
 
   test('backups without auth returns 401/403', async () => {
@@ -353,10 +340,6 @@ describe('Backup (HTTP)', () => {
     baseUrl = await startServer();
   });
 
-  afterAll(async () => {
-    await stopServer();
-  });
-
   test('GET backup via HTTP', async () => {
     const res = await fetch(`${baseUrl}/api/v1/backup`, { headers: apiHeaders() });
     expect(res.status).toBe(200);
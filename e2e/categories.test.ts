@@ -1,78 +1,64 @@
-import { describe, test, expect, beforeAll, afterAll } from 'bun:test';
-import { getApp, startServer, stopServer } from './setup';
-import { apiHeaders, seedCategory, seedMonth, seedExpense, seedPeriod } from './helpers';
+import { describe, test, expect, beforeAll } from 'bun:test';
+import { getApp, startServer } from './setup';
+import {
+  apiClient,
+  httpApiClient,
+  describeNotFound,
+  expectJson,
+  seedCategory,
+  seedMonth,
+  seedExpense,
+  seedPeriod,
+  type ApiClient,
+} from './helpers';
 import type { Hono } from 'hono';
 
 let app: Hono;
+let client: ApiClient;
 
 beforeAll(async () => {
   app = await getApp();
+  client = apiClient(app);
 });
 
 describe('Categories (Hono client)', () => {
+  describeNotFound('categories', () => client, { name: 'x' });
+
   test('list categories', async () => {
-    const res = await app.request('/api/v1/categories', { headers: apiHeaders() });
+    const res = await client.get('/api/v1/categories');
     expect(res.status).toBe(200);
     const data = (await res.json()) as unknown[];
     expect(Array.isArray(data)).toBe(true);
   });
 
   test('create a category', async () => {
-    const res = await app.request('/api/v1/categories', {
-      method: 'POST',
-      headers: apiHeaders(),
-      body: JSON.stringify({ name: 'Food', color: '#ff0000' }),
-    });
-    expect(res.status).toBe(201);
-    const data = (await res.json()) as { id: number; name: string; color: string };
-    expect(data.name).toBe('Food');
-    expect(data.color).toBe('#ff0000');
+    const res = await client.post('/api/v1/categories', { name: 'Food', color: '#ff0000' });
+    await expectJson(res, 201, { name: 'Food', color: '#ff0000' });
   });
 
   test('create duplicate category fails', async () => {
-    const res = await app.request('/api/v1/categories', {
-      method: 'POST',
-      headers: apiHeaders(),
-      body: JSON.stringify({ name: 'Food' }),
-    });
+    const res = await client.post('/api/v1/categories', { name: 'Food' });
     expect(res.status).toBe(400);
   });
 
   test('get category by id', async () => {
     const cat = await seedCategory(app, 'Transport', '#00ff00');
-    const res = await app.request(`/api/v1/categories/${cat.id}`, { headers: apiHeaders() });
-    expect(res.status).toBe(200);
-    const data = (await res.json()) as { name: string };
-    expect(data.name).toBe('Transport');
-  });
-
-  test('get non-existent category returns 404', async () => {
-    const res = await app.request('/api/v1/categories/99999', { headers: apiHeaders() });
-    expect(res.status).toBe(404);
+    const res = await client.get(`/api/v1/categories/${cat.id}`);
+    await expectJson(res, 200, { name: 'Transport' });
   });
 
   test('update a category', async () => {
     const cat = await seedCategory(app, 'Utils');
-    const res = await app.request(`/api/v1/categories/${cat.id}`, {
-      method: 'PUT',
-      headers: apiHeaders(),
-      body: JSON.stringify({ name: 'Utilities', color: '#bbb' }),
-    });
-    expect(res.status).toBe(200);
-    const data = (await res.json()) as { name: string; color: string };
-    expect(data.name).toBe('Utilities');
-    expect(data.color).toBe('#bbb');
+    const res = await client.put(`/api/v1/categories/${cat.id}`, { name: 'Utilities', color: '#bbb' });
+    await expectJson(res, 200, { name: 'Utilities', color: '#bbb' });
   });
 
   test('delete a category with no dependencies', async () => {
     const cat = await seedCategory(app, 'ToDelete');
-    const res = await app.request(`/api/v1/categories/${cat.id}`, {
-      method: 'DELETE',
-      headers: apiHeaders(),
-    });
+    const res = await client.delete(`/api/v1/categories/${cat.id}`);
     expect(res.status).toBe(200);
 
-    const getRes = await app.request(`/api/v1/categories/${cat.id}`, { headers: apiHeaders() });
+    const getRes = await client.get(`/api/v1/categories/${cat.id}`);
     expect(getRes.status).toBe(404);
   });
 
@@ -87,15 +73,12 @@ describe('Categories (Hono client)', () => {
       budget: 1000,
     });
 
-    const res = await app.request(`/api/v1/categories/${cat.id}`, {
-      method: 'DELETE',
-      headers: apiHeaders(),
-    });
+    const res = await client.delete(`/api/v1/categories/${cat.id}`);
     expect(res.status).toBe(409);
   });
 
   test('category summary', async () => {
-    const res = await app.request('/api/v1/categories/summary', { headers: apiHeaders() });
+    const res = await client.get('/api/v1/categories/summary');
     expect(res.status).toBe(200);
     const data = (await res.json()) as Array<{ category: string; budget: number; total: number }>;
     expect(Array.isArray(data)).toBe(true);
@@ -103,29 +86,19 @@ describe('Categories (Hono client)', () => {
 });
 
 describe('Categories (HTTP)', () => {
-  let baseUrl: string;
+  let http: ApiClient;
 
   beforeAll(async () => {
-    baseUrl = await startServer();
-  });
-
-  afterAll(async () => {
-    await stopServer();
+    http = httpApiClient(await startServer());
   });
 
   test('create and list categories via HTTP', async () => {
-    const createRes = await fetch(`${baseUrl}/api/v1/categories`, {
-      method: 'POST',
-      headers: apiHeaders(),
-      body: JSON.stringify({ name: 'HTTP-Cat', color: '#123456' }),
-    });
+    const createRes = await http.post('/api/v1/categories', { name: 'HTTP-Cat', color: '#123456' });
     expect(createRes.status).toBe(201);
 
-    const listRes = await fetch(`${baseUrl}/api/v1/categories`, {
-      headers: apiHeaders(),
-    });
+    const listRes = await http.get('/api/v1/categories');
     expect(listRes.status).toBe(200);
     const data = (await listRes.json()) as Array<{ name: string }>;
-    expect(data.some((c) => c.name === 'HTTP-Cat')).toBe(true);
+    expect(data.map((c) => c.name)).toContain('HTTP-Cat');
   });
 });
@@ -0,0 +1,24 @@
+import { describe, test, expect } from 'bun:test';
+import { join } from 'node:path';
+
+const CONFIG_MODULE = join(import.meta.dir, '../backend/src/config.ts');
+
+/** Load the config module in a fresh bun process with one env override. */
+function loadConfig(key: string, value: string) {
+  const script = `await import(${JSON.stringify(CONFIG_MODULE)})`;
+  return Bun.spawnSync([process.execPath, '-e', script], {
+    env: { ...process.env, [key]: value },
+  });
+}
+
+describe('config', () => {
+  test.each(['ten', '3', '32', '10.5', ''])('rejects BCRYPT_COST=%p at load', (value) => {
+    const result = loadConfig('BCRYPT_COST', value);
+    expect(result.exitCode).not.toBe(0);
+    expect(result.stderr.toString()).toContain('Invalid BCRYPT_COST');
+  });
+
+  test('accepts a valid BCRYPT_COST', () => {
+    expect(loadConfig('BCRYPT_COST', '12').exitCode).toBe(0);
+  });
+});
@@ -1,66 +1,63 @@
-import { describe, test, expect, beforeAll, afterAll } from 'bun:test';
-import { getApp, startServer, stopServer } from './setup';
-import { apiHeaders, seedMonth, seedPeriod, seedCategory, seedExpense } from './helpers';
+import { describe, test, expect, beforeAll } from 'bun:test';
+import { getApp, startServer } from './setup';
+import {
+  apiClient,
+  httpApiClient,
+  expectJson,
+  seedMonth,
+  seedFixtures,
+  seedExpense,
+  insertExpenses,
+  type ApiClient,
+} from './helpers';
 import type { Hono } from 'hono';
 
 let app: Hono;
+let client: ApiClient;
 let monthId: number;
 let periodName: string;
 let categoryName: string;
 
 beforeAll(async () => {
   app = await getApp();
-  const period = await seedPeriod(app, 'Exp-Period');
-  const cat = await seedCategory(app, 'Exp-Category');
-  const month = await seedMonth(app, 2025, 5);
+  client = apiClient(app);
+  const { period, category, month } = await seedFixtures(app, 'Exp', 2025, 5);
   monthId = month.id;
   periodName = period.name;
-  categoryName = cat.name;
+  categoryName = category.name;
 });
 
 describe('Expenses (Hono client)', () => {
   test('list expenses', async () => {
-    const res = await app.request('/api/v1/expenses', { headers: apiHeaders() });
+    const res = await client.get('/api/v1/expenses');
     expect(res.status).toBe(200);
     const data = (await res.json()) as unknown[];
     expect(Array.isArray(data)).toBe(true);
   });
 
   test('create an expense', async () => {
-    const res = await app.request('/api/v1/expenses', {
-      method: 'POST',
-      headers: apiHeaders(),
-      body: JSON.stringify({
-        expense_name: 'Groceries',
-        period: periodName,
-        category: categoryName,
-        budget: 300,
-        cost: 150,
-        month_id: monthId,
-      }),
+    const res = await client.post('/api/v1/expenses', {
+      expense_name: 'Groceries',
+      period: periodName,
+      category: categoryName,
+      budget: 300,
+      cost: 150,
+      month_id: monthId,
     });
-    expect(res.status).toBe(201);
-    const data = (await res.json()) as { id: number; expense_name: string; budget: number; cost: number };
-    expect(data.expense_name).toBe('Groceries');
-    expect(data.budget).toBe(300);
-    expect(data.cost).toBe(150);
+    await expectJson(res, 201, { expense_name: 'Groceries', budget: 300, cost: 150 });
   });
 
   test('create expense with purchases calculates cost', async () => {
-    const res = await app.request('/api/v1/expenses', {
-      method: 'POST',
-      headers: apiHeaders(),
-      body: JSON.stringify({
-        expense_name: 'Dining Out',
-        period: periodName,
-        category: categoryName,
-        budget: 200,
-        month_id: monthId,
-        purchases: [
-          { name: 'Restaurant A', amount: 50 },
-          { name: 'Restaurant B', amount: 30 },
-        ],
-      }),
+    const res = await client.post('/api/v1/expenses', {
+      expense_name: 'Dining Out',
+      period: periodName,
+      category: categoryName,
+      budget: 200,
+      month_id: monthId,
+      purchases: [
+        { name: 'Restaurant A', amount: 50 },
+        { name: 'Restaurant B', amount: 30 },
+      ],
     });
     expect(res.status).toBe(201);
     const data = (await res.json()) as { cost: number; purchases: Array<{ name: string; amount: number }> };
@@ -69,15 +66,11 @@ describe('Expenses (Hono client)', () => {
   });
 
   test('create expense for non-existent month fails', async () => {
-    const res = await app.request('/api/v1/expenses', {
-      method: 'POST',
-      headers: apiHeaders(),
-      body: JSON.stringify({
-        expense_name: 'Bad',
-        period: periodName,
-        category: categoryName,
-        month_id: 99999,
-      }),
+    const res = await client.post('/api/v1/expenses', {
+      expense_name: 'Bad',
+      period: periodName,
+      category: categoryName,
+      month_id: 99999,
     });
     expect(res.status).toBe(400);
   });
@@ -88,14 +81,12 @@ describe('Expenses (Hono client)', () => {
       period: periodName,
       category: categoryName,
     });
-    const res = await app.request(`/api/v1/expenses/${exp.id}`, { headers: apiHeaders() });
-    expect(res.status).toBe(200);
-    const data = (await res.json()) as { expense_name: string };
-    expect(data.expense_name).toBe('GetById');
+    const res = await client.get(`/api/v1/expenses/${exp.id}`);
+    await expectJson(res, 200, { expense_name: 'GetById' });
   });
 
   test('get non-existent expense returns 404', async () => {
-    const res = await app.request('/api/v1/expenses/99999', { headers: apiHeaders() });
+    const res = await client.get('/api/v1/expenses/99999');
     expect(res.status).toBe(404);
   });
 
@@ -106,15 +97,8 @@ describe('Expenses (Hono client)', () => {
       category: categoryName,
       budget: 100,
     });
-    const res = await app.request(`/api/v1/expenses/${exp.id}`, {
-      method: 'PUT',
-      headers: apiHeaders(),
-      body: JSON.stringify({ expense_name: 'Updated', cost: 75 }),
-    });
-    expect(res.status).toBe(200);
-    const data = (await res.json()) as { expense_name: string; cost: number };
-    expect(data.expense_name).toBe('Updated');
-    expect(data.cost).toBe(75);
+    const res = await client.put(`/api/v1/expenses/${exp.id}`, { expense_name: 'Updated', cost: 75 });
+    await expectJson(res, 200, { expense_name: 'Updated', cost: 75 });
   });
 
   test('delete an expense', async () => {
@@ -123,51 +107,70 @@ describe('Expenses (Hono client)', () => {
       period: periodName,
       category: categoryName,
     });
-    const res = await app.request(`/api/v1/expenses/${exp.id}`, {
-      method: 'DELETE',
-      headers: apiHeaders(),
-    });
+    const res = await client.delete(`/api/v1/expenses/${exp.id}`);
     expect(res.status).toBe(200);
 
-    const getRes = await app.request(`/api/v1/expenses/${exp.id}`, { headers: apiHeaders() });
+    const getRes = await client.get(`/api/v1/expenses/${exp.id}`);
     expect(getRes.status).toBe(404);
   });
 
-  test('cannot add expense to closed month', async () => {
-    const closedMonth = await seedMonth(app, 2020, 1);
-    await app.request(`/api/v1/months/${closedMonth.id}/close`, {
-      method: 'POST',
-      headers: apiHeaders(),
-    });
+  describe('closed month', () => {
+    let closedMonthId: number;
+    let closedExpenseId: number;
 
-    const res = await app.request('/api/v1/expenses', {
-      method: 'POST',
-      headers: apiHeaders(),
-      body: JSON.stringify({
-        expense_name: 'Blocked',
+    // One closed month with one expense serves every blocked operation below.
+    beforeAll(async () => {
+      const closedMonth = await seedMonth(app, 2020, 1);
+      closedMonthId = closedMonth.id;
+      const exp = await seedExpense(app, closedMonthId, {
+        expense_name: 'InClosedMonth',
         period: periodName,
         category: categoryName,
-        month_id: closedMonth.id,
-      }),
+      });
+      closedExpenseId = exp.id;
+      await client.post(`/api/v1/months/${closedMonthId}/close`);
+    });
+
+    const blockedPayload = () => ({
+      expense_name: 'Blocked',
+      period: periodName,
+      category: categoryName,
+      month_id: closedMonthId,
+    });
+
+    test.each([
+      ['add', () => client.post('/api/v1/expenses', blockedPayload())],
+      ['update', () => client.put(`/api/v1/expenses/${closedExpenseId}`, blockedPayload())],
+      ['delete', () => client.delete(`/api/v1/expenses/${closedExpenseId}`)],
+    ] as const)('cannot %s expense in closed month', async (_action, send) => {
+      const res = await send();
+      expect(res.status).toBe(400);
     });
-    expect(res.status).toBe(400);
   });
 
   test('reorder expenses', async () => {
-    const e1 = await seedExpense(app, monthId, { expense_name: 'Reorder1', period: periodName, category: categoryName });
-    const e2 = await seedExpense(app, monthId, { expense_name: 'Reorder2', period: periodName, category: categoryName });
-    const e3 = await seedExpense(app, monthId, { expense_name: 'Reorder3', period: periodName, category: categoryName });
-
-    const res = await app.request('/api/v1/expenses/reorder', {
-      method: 'POST',
-      headers: apiHeaders(),
-      body: JSON.stringify({ expense_ids: [e3.id, e1.id, e2.id] }),
-    });
+    const [e1, e2, e3] = insertExpenses(
+      monthId,
+      [{ expense_name: 'Reorder1' }, { expense_name: 'Reorder2' }, { expense_name: 'Reorder3' }],
+      { period: periodName, category: categoryName },
+    );
+
+    const res = await client.post('/api/v1/expenses/reorder', { expense_ids: [e3.id, e1.id, e2.id] });
     expect(res.status).toBe(200);
-    const data = (await res.json()) as Array<{ id: number }>;
-    expect(data[0].id).toBe(e3.id);
-    expect(data[1].id).toBe(e1.id);
-    expect(data[2].id).toBe(e2.id);
+    const data = (await res.json()) as Array<{ id: number; order: number }>;
+    expect(data.map((e) => e.id)).toEqual([e3.id, e1.id, e2.id]);
+    expect(data.map((e) => e.order)).toEqual([0, 1, 2]);
+  });
+
+  test('reorder with a repeated expense id fails', async () => {
+    const [e1, e2] = insertExpenses(
+      monthId,
+      [{ expense_name: 'Dup1' }, { expense_name: 'Dup2' }],
+      { period: periodName, category: categoryName },
+    );
+
+    const res = await client.post('/api/v1/expenses/reorder', { expense_ids: [e1.id, e2.id, e1.id] });
+    expect(res.status).toBe(400);
   });
 
   test('pay an expense', async () => {
@@ -178,11 +181,7 @@ describe('Expenses (Hono client)', () => {
       budget: 100,
     });
 
-    const res = await app.request(`/api/v1/expenses/${exp.id}/pay`, {
-      method: 'POST',
-      headers: apiHeaders(),
-      body: JSON.stringify({ amount: 100, name: 'Full Payment' }),
-    });
+    const res = await client.post(`/api/v1/expenses/${exp.id}/pay`, { amount: 100, name: 'Full Payment' });
     expect(res.status).toBe(200);
     const data = (await res.json()) as { cost: number; purchases: Array<{ name: string; amount: number }> };
     expect(data.cost).toBe(100);
@@ -191,7 +190,7 @@ describe('Expenses (Hono client)', () => {
   });
 
   test('filter expenses by month_id', async () => {
-    const res = await app.request(`/api/v1/expenses?month_id=${monthId}`, { headers: apiHeaders() });
+    const res = await client.get('/api/v1/expenses', { month_id: monthId });
     expect(res.status).toBe(200);
     const data = (await res.json()) as Array<{ month_id: number }>;
     expect(data.every((e) => e.month_id === monthId)).toBe(true);
@@ -199,34 +198,24 @@ describe('Expenses (Hono client)', () => {
 });
 
 describe('Expenses (HTTP)', () => {
-  let baseUrl: string;
+  let http: ApiClient;
 
   beforeAll(async () => {
-    baseUrl = await startServer();
-  });
-
-  afterAll(async () => {
-    await stopServer();
+    http = httpApiClient(await startServer());
   });
 
   test('create and get expense via HTTP', async () => {
-    const createRes = await fetch(`${baseUrl}/api/v1/expenses`, {
-      method: 'POST',
-      headers: apiHeaders(),
-      body: JSON.stringify({
-        expense_name: 'HTTP-Expense',
-        period: periodName,
-        category: categoryName,
-        budget: 100,
-        month_id: monthId,
-      }),
+    const createRes = await http.post('/api/v1/expenses', {
+      expense_name: 'HTTP-Expense',
+      period: periodName,
+      category: categoryName,
+      budget: 100,
+      month_id: monthId,
     });
     expect(createRes.status).toBe(201);
     const created = (await createRes.json()) as { id: number };
 
-    const getRes = await fetch(`${baseUrl}/api/v1/expenses/${created.id}`, {
-      headers: apiHeaders(),
-    });
+    const getRes = await http.get(`/api/v1/expenses/${created.id}`);
     expect(getRes.status).toBe(200);
     const data = (await getRes.json()) as { expense_name: string };
     expect(data.expense_name).toBe('HTTP-Expense');
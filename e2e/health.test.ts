@@ -1,10 +1,11 @@
 import { describe, test, expect, beforeAll, afterAll } from 'bun:test';
 import { existsSync, mkdirSync, unlinkSync, writeFileSync } from 'node:fs';
 import { join } from 'node:path';
-import { getApp, startServer, stopServer } from './setup';
+import { getApp, startServer } from './setup';
 import type { Hono } from 'hono';
 
 let app: Hono;
+const HEALTH_PATHS = ['/health', '/api/v1/health'];
 const staticFixturePath = join(import.meta.dir, '../backend/public/e2e-static.js');
 
 beforeAll(async () => {
@@ -18,21 +19,14 @@ afterAll(() => {
 });
 
 describe('Health (Hono client)', () => {
-  test('GET /health returns 200', async () => {
-    const res = await app.request('/health');
+  test.each(HEALTH_PATHS)('GET %s returns 200', async (path) => {
+    const res = await app.request(path);
     expect(res.status).toBe(200);
     const data = (await res.json()) as { status: string; timestamp: string };
     expect(data.status).toBe('healthy');
     expect(data.timestamp).toBeDefined();
   });
 
-  test('GET /api/v1/health returns 200', async () => {
-    const res = await app.request('/api/v1/health');
-    expect(res.status).toBe(200);
-    const data = (await res.json()) as { status: string };
-    expect(data.status).toBe('healthy');
-  });
-
   test('GET /public/* serves frontend static assets', async () => {
     const res = await app.request('/public/e2e-static.js');
     expect(res.status).toBe(200);
@@ -48,22 +42,11 @@ describe('Health (HTTP)', () => {
     baseUrl = await startServer();
   });
 
-  afterAll(async () => {
-    await stopServer();
-  });
-
-  test('GET /health returns 200', async () => {
-    const res = await fetch(`${baseUrl}/health`);
+  test.each(HEALTH_PATHS)('GET %s returns 200', async (path) => {
+    const res = await fetch(`${baseUrl}${path}`);
     expect(res.status).toBe(200);
     const data = (await res.json()) as { status: string; timestamp: string };
     expect(data.status).toBe('healthy');
     expect(data.timestamp).toBeDefined();
   });
-
-  test('GET /api/v1/health returns 200', async () => {
-    const res = await fetch(`${baseUrl}/api/v1/health`);
-    expect(res.status).toBe(200);
-    const data = (await res.json()) as { status: string };
-    expect(data.status).toBe('healthy');
-  });
 });
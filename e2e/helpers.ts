@@ -2,37 +2,176 @@
  * Reusable test utilities for E2E tests.
  */
 
+import { describe, expect, test } from 'bun:test';
 import type { Hono } from 'hono';
+import * as connection from '../backend/src/db/connection';
+import { expenses, incomes, incomeTypes } from '../backend/src/db/schema';
 
 const API_KEY = 'test-api-key';
 
 // ─── Headers ────────────────────────────────────────────────────────────────
 
+// Shared by every unauthenticated request; frozen so no caller can alter it.
+const BASE_HEADERS: Record<string, string> = Object.freeze({
+  'X-API-Key': API_KEY,
+  'Content-Type': 'application/json',
+});
+
+// A suite reuses the same few tokens for every request, so build each
+// token's headers once.
+const tokenHeaders = new Map<string, Record<string, string>>();
+
+/**
+ * Request headers with the test API key (and bearer token, if given).
+ * The returned object is shared and frozen — never modify it.
+ */
 export function apiHeaders(token?: string): Record<string, string> {
-  const headers: Record<string, string> = {
-    'X-API-Key': API_KEY,
-    'Content-Type': 'application/json',
-  };
-  if (token) {
-    headers['Authorization'] = `Bearer ${token}`;
+  if (!token) {
+    return BASE_HEADERS;
+  }
+  let headers = tokenHeaders.get(token);
+  if (!headers) {
+    headers = Object.freeze({ ...BASE_HEADERS, Authorization: `Bearer ${token}` });
+    tokenHeaders.set(token, headers);
   }
   return headers;
 }
 
+/** Headers for multipart uploads: no Content-Type, so FormData sets its boundary. */
+export function uploadHeaders(token?: string): Record<string, string> {
+  const { 'Content-Type': _contentType, ...headers } = apiHeaders(token);
+  return headers;
+}
+
+// ─── API clients ────────────────────────────────────────────────────────────
+
+type Requester = (path: string, init: RequestInit) => Response | Promise<Response>;
+
+function viaApp(app: Hono): Requester {
+  return (path, init) => app.request(path, init);
+}
+
+function viaHttp(baseUrl: string): Requester {
+  return (path, init) => fetch(`${baseUrl}${path}`, init);
+}
+
+export type ApiClient = ReturnType<typeof createClient>;
+
+function stringifyValues(query: Record<string, string | number>): Record<string, string> {
+  return Object.fromEntries(Object.entries(query).map(([key, value]) => [key, String(value)]));
+}
+
+function createClient(request: Requester, token?: string) {
+  // Built once per client and shared by every call it makes.
+  const headers = apiHeaders(token);
+  const send = (method: string, path: string, body?: unknown) =>
+    request(path, {
+      method,
+      headers,
+      body: body === undefined ? undefined : JSON.stringify(body),
+    });
+
+  return {
+    get: (path: string, query?: Record<string, string | number>) =>
+      send('GET', query ? `${path}?${new URLSearchParams(stringifyValues(query))}` : path),
+    post: (path: string, body?: unknown) => send('POST', path, body),
+    put: (path: string, body?: unknown) => send('PUT', path, body),
+    delete: (path: string) => send('DELETE', path),
+  };
+}
+
+/** Client for the in-process Hono app with the API key (and token) preset. */
+export function apiClient(app: Hono, token?: string): ApiClient {
+  return createClient(viaApp(app), token);
+}
+
+/** Same as apiClient, but talks to a running server over HTTP. */
+export function httpApiClient(baseUrl: string, token?: string): ApiClient {
+  return createClient(viaHttp(baseUrl), token);
+}
+
+// ─── Assertions ─────────────────────────────────────────────────────────────
+
+/**
+ * Assert a response's status and the given top-level fields, decoding the
+ * body once. Returns the parsed body for any further checks.
+ */
+export async function expectJson<T = Record<string, unknown>>(
+  res: Response,
+  status: number,
+  fields: Record<string, unknown> = {},
+): Promise<T> {
+  expect(res.status).toBe(status);
+  const data = (await res.json()) as T;
+  expect(data).toMatchObject(fields);
+  return data;
+}
+
+/**
+ * Table-driven 404 checks for a resource's by-id endpoints: GET, PUT (with
+ * `updateBody`), DELETE, plus any POST sub-actions such as `close`. The client
+ * is a thunk because suites create theirs in beforeAll.
+ */
+export function describeNotFound(
+  resource: string,
+  getClient: () => ApiClient,
+  updateBody: object,
+  postActions: string[] = [],
+) {
+  const path = `/api/v1/${resource}/99999`;
+  type Send = () => Response | Promise<Response>;
+  const sends: Array<[string, Send]> = [
+    ['get', () => getClient().get(path)],
+    ['update', () => getClient().put(path, updateBody)],
+    ['delete', () => getClient().delete(path)],
+    ...postActions.map((action): [string, Send] => [
+      action,
+      () => getClient().post(`${path}/${action}`),
+    ]),
+  ];
+
+  describe(`missing ${resource}`, () => {
+    test.each(sends)('%s returns 404 with a detail message', async (_action, send) => {
+      const data = await expectJson<{ detail: unknown }>(await send(), 404);
+      expect(typeof data.detail).toBe('string');
+    });
+  });
+}
+
 // ─── Auth helpers ───────────────────────────────────────────────────────────
 
+// The auth flows are identical for the Hono client and the real server; only
+// the transport differs, so each helper is written once against a Requester.
+
+async function register(request: Requester, email: string, password: string, fullName: string) {
+  return request('/api/v1/auth/register', {
+    method: 'POST',
+    headers: apiHeaders(),
+    body: JSON.stringify({ email, password, full_name: fullName }),
+  });
+}
+
+async function login(request: Requester, email: string, password: string) {
+  return request('/api/v1/auth/login', {
+    method: 'POST',
+    headers: apiHeaders(),
+    body: JSON.stringify({ email, password }),
+  });
+}
+
+async function token(request: Requester, email: string, password: string): Promise<string> {
+  const res = await login(request, email, password);
+  const data = (await res.json()) as { access_token: string };
+  return data.access_token;
+}
+
 export async function registerUser(
   app: Hono,
   email = 'test@example.com',
   password = 'testpass123',
   fullName = 'Test User',
 ) {
-  const res = await app.request('/api/v1/auth/register', {
-    method: 'POST',
-    headers: apiHeaders(),
-    body: JSON.stringify({ email, password, full_name: fullName }),
-  });
-  return res;
+  return register(viaApp(app), email, password, fullName);
 }
 
 export async function loginUser(
@@ -40,12 +179,7 @@ export async function loginUser(
   email = 'test@example.com',
   password = 'testpass123',
 ) {
-  const res = await app.request('/api/v1/auth/login', {
-    method: 'POST',
-    headers: apiHeaders(),
-    body: JSON.stringify({ email, password }),
-  });
-  return res;
+  return login(viaApp(app), email, password);
 }
 
 export async function getToken(
@@ -53,9 +187,7 @@ export async function getToken(
   email = 'test@example.com',
   password = 'testpass123',
 ): Promise<string> {
-  const res = await loginUser(app, email, password);
-  const data = (await res.json()) as { access_token: string };
-  return data.access_token;
+  return token(viaApp(app), email, password);
 }
 
 export async function registerAndGetToken(
@@ -64,8 +196,9 @@ export async function registerAndGetToken(
   password = 'testpass123',
   fullName = 'Test User',
 ): Promise<string> {
-  await registerUser(app, email, password, fullName);
-  return getToken(app, email, password);
+  const request = viaApp(app);
+  await register(request, email, password, fullName);
+  return token(request, email, password);
 }
 
 // ─── HTTP fetch helpers (for real server tests) ─────────────────────────────
@@ -76,11 +209,7 @@ export async function httpRegisterUser(
   password = 'testpass123',
   fullName = 'Test User',
 ) {
-  return fetch(`${baseUrl}/api/v1/auth/register`, {
-    method: 'POST',
-    headers: apiHeaders(),
-    body: JSON.stringify({ email, password, full_name: fullName }),
-  });
+  return register(viaHttp(baseUrl), email, password, fullName);
 }
 
 export async function httpLoginUser(
@@ -88,11 +217,7 @@ export async function httpLoginUser(
   email = 'test@example.com',
   password = 'testpass123',
 ) {
-  return fetch(`${baseUrl}/api/v1/auth/login`, {
-    method: 'POST',
-    headers: apiHeaders(),
-    body: JSON.stringify({ email, password }),
-  });
+  return login(viaHttp(baseUrl), email, password);
 }
 
 export async function httpGetToken(
@@ -100,9 +225,7 @@ export async function httpGetToken(
   email = 'test@example.com',
   password = 'testpass123',
 ): Promise<string> {
-  const res = await httpLoginUser(baseUrl, email, password);
-  const data = (await res.json()) as { access_token: string };
-  return data.access_token;
+  return token(viaHttp(baseUrl), email, password);
 }
 
 export async function httpRegisterAndGetToken(
@@ -111,8 +234,9 @@ export async function httpRegisterAndGetToken(
   password = 'testpass123',
   fullName = 'Test User',
 ): Promise<string> {
-  await httpRegisterUser(baseUrl, email, password, fullName);
-  return httpGetToken(baseUrl, email, password);
+  const request = viaHttp(baseUrl);
+  await register(request, email, password, fullName);
+  return token(request, email, password);
 }
 
 // ─── Seed data helpers ──────────────────────────────────────────────────────
@@ -189,3 +313,77 @@ export async function seedIncome(
   });
   return (await res.json()) as { id: number };
 }
+
+/**
+ * Seed the period, category, income type and month most tests build on.
+ * Names are `${prefix}-Period`, `${prefix}-Category` and `${prefix}-Salary`,
+ * so each file passes its own prefix to stay clear of the others.
+ */
+export async function seedFixtures(app: Hono, prefix: string, year: number, month: number) {
+  // The four rows are independent, so the requests are issued together.
+  const [period, category, incomeType, monthRow] = await Promise.all([
+    seedPeriod(app, `${prefix}-Period`),
+    seedCategory(app, `${prefix}-Category`),
+    seedIncomeType(app, `${prefix}-Salary`),
+    seedMonth(app, year, month),
+  ]);
+  return { period, category, incomeType, month: monthRow };
+}
+
+// ─── Direct DB seeding ──────────────────────────────────────────────────────
+
+// Expense period/category and income period are free-text columns, so
+// placeholder names are fine for rows a test never groups or filters on.
+const DEFAULT_EXPENSE_FIELDS = { period: 'E2E-Period', category: 'E2E-Category' };
+const DEFAULT_INCOME_FIELDS = { period: 'E2E-Period' };
+
+/**
+ * Insert expenses with a single multi-row INSERT, bypassing the API.
+ *
+ * For rows a test only needs to exist — the create endpoint's validation and
+ * bookkeeping are covered by its own tests. Fields shared by every row go in
+ * `defaults`; each row only spells out what sets it apart.
+ */
+export function insertExpenses(
+  monthId: number,
+  rows: Array<{
+    expense_name: string;
+    period?: string;
+    category?: string;
+    budget?: number;
+    cost?: number;
+    order?: number;
+  }>,
+  defaults: { period?: string; category?: string } = {},
+) {
+  const shared = { ...DEFAULT_EXPENSE_FIELDS, ...defaults, month_id: monthId };
+  return connection.db
+    .insert(expenses)
+    .values(rows.map((row) => ({ ...shared, ...row })))
+    .returning()
+    .all();
+}
+
+/** Insert one income type directly, bypassing the API. */
+export function insertIncomeType(name: string, color = '#10b981') {
+  return connection.db.insert(incomeTypes).values({ name, color }).returning().get();
+}
+
+/** Insert incomes with a single multi-row INSERT, bypassing the API. */
+export function insertIncomes(
+  rows: Array<{
+    month_id: number;
+    income_type_id: number;
+    period?: string;
+    budget?: number;
+    amount?: number;
+  }>,
+  defaults: { period?: string } = {},
+) {
+  const shared = { ...DEFAULT_INCOME_FIELDS, ...defaults };
+  return connection.db
+    .insert(incomes)
+    .values(rows.map((row) => ({ ...shared, ...row })))
+    .returning()
+    .all();
+}
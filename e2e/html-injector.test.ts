@@ -0,0 +1,31 @@
+import { describe, test, expect } from 'bun:test';
+import { injectApiKey } from '../backend/src/utils/html-injector';
+
+const SCRIPT = '<script>window.APP_CONFIG = {"API_KEY":"k"};</script>';
+
+describe('injectApiKey', () => {
+  test.each([
+    [
+      'before </head>',
+      '<html><head></head><body></body></html>',
+      `<html><head>${SCRIPT}\n</head><body></body></html>`,
+    ],
+    ['before </head> case-insensitively', '<HEAD></HEAD>', `<HEAD>${SCRIPT}\n</HEAD>`],
+    ['before </body> without a head', '<p>x</p></body>', `<p>x</p>${SCRIPT}\n</body>`],
+    ['after an opening <body>', '<body><p>x</p>', `<body>\n${SCRIPT}<p>x</p>`],
+    [
+      'after an opening <body> with attributes',
+      '<body class="app"><p>x</p></body>',
+      `<body class="app">\n${SCRIPT}<p>x</p></body>`,
+    ],
+  ])('injects %s', (_case, html, expected) => {
+    expect(injectApiKey(html, 'k')).toBe(expected);
+  });
+
+  test.each([
+    ['no injection point', '<p>fragment</p>'],
+    ['only a tag that starts with "body"', '<bodyfoo><p>x</p></bodyfoo>'],
+  ])('returns HTML with %s unchanged', (_case, html) => {
+    expect(injectApiKey(html, 'k')).toBe(html);
+  });
+});
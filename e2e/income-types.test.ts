@@ -1,116 +1,97 @@
-import { describe, test, expect, beforeAll, afterAll } from 'bun:test';
-import { getApp, startServer, stopServer } from './setup';
-import { apiHeaders, seedIncomeType, seedPeriod, seedMonth, seedIncome } from './helpers';
+import { describe, test, expect, beforeAll } from 'bun:test';
+import { getApp, startServer, useSavepointIsolation } from './setup';
+import {
+  apiClient,
+  httpApiClient,
+  describeNotFound,
+  expectJson,
+  seedIncomeType,
+  insertIncomeType,
+  seedPeriod,
+  seedMonth,
+  seedIncome,
+  type ApiClient,
+} from './helpers';
 import type { Hono } from 'hono';
 
 let app: Hono;
+let client: ApiClient;
+let sharedType: { id: number; name: string };
 
 beforeAll(async () => {
   app = await getApp();
+  client = apiClient(app);
+  // Seeded outside the per-test savepoint; tests that rename it are rolled back.
+  sharedType = await seedIncomeType(app, 'Freelance');
 });
 
+useSavepointIsolation();
+
 describe('Income Types (Hono client)', () => {
+  describeNotFound('income-types', () => client, { name: 'x' });
+
   test('list income types', async () => {
-    const res = await app.request('/api/v1/income-types', { headers: apiHeaders() });
+    const res = await client.get('/api/v1/income-types');
     expect(res.status).toBe(200);
     const data = (await res.json()) as unknown[];
     expect(Array.isArray(data)).toBe(true);
   });
 
   test('create an income type', async () => {
-    const res = await app.request('/api/v1/income-types', {
-      method: 'POST',
-      headers: apiHeaders(),
-      body: JSON.stringify({ name: 'Salary', color: '#10b981' }),
-    });
-    expect(res.status).toBe(201);
-    const data = (await res.json()) as { id: number; name: string };
-    expect(data.name).toBe('Salary');
+    const res = await client.post('/api/v1/income-types', { name: 'Salary', color: '#10b981' });
+    await expectJson(res, 201, { name: 'Salary' });
   });
 
   test('create duplicate income type fails', async () => {
-    const res = await app.request('/api/v1/income-types', {
-      method: 'POST',
-      headers: apiHeaders(),
-      body: JSON.stringify({ name: 'Salary' }),
-    });
+    insertIncomeType('Salary');
+    const res = await client.post('/api/v1/income-types', { name: 'Salary' });
     expect(res.status).toBe(400);
   });
 
   test('get income type by id', async () => {
-    const it = await seedIncomeType(app, 'Freelance');
-    const res = await app.request(`/api/v1/income-types/${it.id}`, { headers: apiHeaders() });
-    expect(res.status).toBe(200);
-    const data = (await res.json()) as { name: string };
-    expect(data.name).toBe('Freelance');
-  });
-
-  test('get non-existent income type returns 404', async () => {
-    const res = await app.request('/api/v1/income-types/99999', { headers: apiHeaders() });
-    expect(res.status).toBe(404);
+    const res = await client.get(`/api/v1/income-types/${sharedType.id}`);
+    await expectJson(res, 200, { name: 'Freelance' });
   });
 
   test('update an income type', async () => {
-    const it = await seedIncomeType(app, 'Bonus');
-    const res = await app.request(`/api/v1/income-types/${it.id}`, {
-      method: 'PUT',
-      headers: apiHeaders(),
-      body: JSON.stringify({ name: 'Annual Bonus', color: '#ff0' }),
-    });
-    expect(res.status).toBe(200);
-    const data = (await res.json()) as { name: string };
-    expect(data.name).toBe('Annual Bonus');
+    const res = await client.put(`/api/v1/income-types/${sharedType.id}`, { name: 'Annual Bonus', color: '#ff0' });
+    await expectJson(res, 200, { name: 'Annual Bonus' });
   });
 
   test('delete income type with no dependencies', async () => {
-    const it = await seedIncomeType(app, 'ToDeleteIT');
-    const res = await app.request(`/api/v1/income-types/${it.id}`, {
-      method: 'DELETE',
-      headers: apiHeaders(),
-    });
+    const it = insertIncomeType('ToDeleteIT');
+    const res = await client.delete(`/api/v1/income-types/${it.id}`);
     expect(res.status).toBe(200);
   });
 
   test('delete income type with dependent incomes fails (409)', async () => {
-    const it = await seedIncomeType(app, 'HasIncomes');
     const period = await seedPeriod(app, 'IT-DepPeriod');
     const month = await seedMonth(app, 2025, 4);
     await seedIncome(app, month.id, {
-      income_type_id: it.id,
+      income_type_id: sharedType.id,
       period: period.name,
       budget: 5000,
     });
 
-    const res = await app.request(`/api/v1/income-types/${it.id}`, {
-      method: 'DELETE',
-      headers: apiHeaders(),
-    });
+    const res = await client.delete(`/api/v1/income-types/${sharedType.id}`);
     expect(res.status).toBe(409);
   });
 });
 
 describe('Income Types (HTTP)', () => {
-  let baseUrl: string;
+  let http: ApiClient;
 
   beforeAll(async () => {
-    baseUrl = await startServer();
-  });
-
-  afterAll(async () => {
-    await stopServer();
+    http = httpApiClient(await startServer());
   });
 
   test('create and list income types via HTTP', async () => {
-    const createRes = await fetch(`${baseUrl}/api/v1/income-types`, {
-      method: 'POST',
-      headers: apiHeaders(),
-      body: JSON.stringify({ name: 'HTTP-Income-Type' }),
-    });
+    const createRes = await http.post('/api/v1/income-types', { name: 'HTTP-Income-Type' });
     expect(createRes.status).toBe(201);
 
-    const listRes = await fetch(`${baseUrl}/api/v1/income-types`, { headers: apiHeaders() });
+    const listRes = await http.get('/api/v1/income-types');
     expect(listRes.status).toBe(200);
     const data = (await listRes.json()) as Array<{ name: string }>;
-    expect(data.some((it) => it.name === 'HTTP-Income-Type')).toBe(true);
+    expect(data.map((it) => it.name)).toContain('HTTP-Income-Type');
   });
 });
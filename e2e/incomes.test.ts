@@ -1,178 +1,127 @@
-import { describe, test, expect, beforeAll, afterAll } from 'bun:test';
-import { getApp, startServer, stopServer } from './setup';
-import { apiHeaders, seedMonth, seedPeriod, seedIncomeType, seedIncome } from './helpers';
+import { describe, test, expect, beforeAll } from 'bun:test';
+import { getApp, startServer, useSavepointIsolation } from './setup';
+import {
+  apiClient,
+  httpApiClient,
+  describeNotFound,
+  expectJson,
+  seedFixtures,
+  seedMonth,
+  seedIncome,
+  insertIncomes,
+  type ApiClient,
+} from './helpers';
 import type { Hono } from 'hono';
 
 let app: Hono;
+let client: ApiClient;
 let monthId: number;
 let periodName: string;
 let incomeTypeId: number;
+// Minimal valid create body for the shared month; tests spread and override it.
+let basePayload: Readonly<{ income_type_id: number; period: string; month_id: number }>;
 
 beforeAll(async () => {
   app = await getApp();
-  const period = await seedPeriod(app, 'Inc-Period');
-  const it = await seedIncomeType(app, 'Inc-Salary');
-  const month = await seedMonth(app, 2023, 5);
+  client = apiClient(app);
+  const { period, incomeType, month } = await seedFixtures(app, 'Inc', 2023, 5);
   monthId = month.id;
   periodName = period.name;
-  incomeTypeId = it.id;
+  incomeTypeId = incomeType.id;
+  basePayload = Object.freeze({ income_type_id: incomeTypeId, period: periodName, month_id: monthId });
 });
 
+useSavepointIsolation();
+
+/** Seed an income in the shared month with the shared type and period. */
+function seedSharedIncome(data: { budget?: number; amount?: number } = {}) {
+  return seedIncome(app, monthId, { ...basePayload, ...data });
+}
+
 describe('Incomes (Hono client)', () => {
+  describeNotFound('incomes', () => client, { amount: 1 });
+
   test('list incomes', async () => {
-    const res = await app.request('/api/v1/incomes', { headers: apiHeaders() });
+    const res = await client.get('/api/v1/incomes');
     expect(res.status).toBe(200);
     const data = (await res.json()) as unknown[];
     expect(Array.isArray(data)).toBe(true);
   });
 
   test('create an income', async () => {
-    const res = await app.request('/api/v1/incomes', {
-      method: 'POST',
-      headers: apiHeaders(),
-      body: JSON.stringify({
-        income_type_id: incomeTypeId,
-        period: periodName,
-        budget: 5000,
-        amount: 5200,
-        month_id: monthId,
-      }),
-    });
-    expect(res.status).toBe(201);
-    const data = (await res.json()) as { id: number; budget: number; amount: number };
-    expect(data.budget).toBe(5000);
-    expect(data.amount).toBe(5200);
+    const res = await client.post('/api/v1/incomes', { ...basePayload, budget: 5000, amount: 5200 });
+    await expectJson(res, 201, { budget: 5000, amount: 5200 });
   });
 
-  test('create income for non-existent month fails', async () => {
-    const res = await app.request('/api/v1/incomes', {
-      method: 'POST',
-      headers: apiHeaders(),
-      body: JSON.stringify({
-        income_type_id: incomeTypeId,
-        period: periodName,
-        month_id: 99999,
-      }),
-    });
-    expect(res.status).toBe(400);
-  });
-
-  test('create income for non-existent income type fails', async () => {
-    const res = await app.request('/api/v1/incomes', {
-      method: 'POST',
-      headers: apiHeaders(),
-      body: JSON.stringify({
-        income_type_id: 99999,
-        period: periodName,
-        month_id: monthId,
-      }),
-    });
+  test.each([
+    ['non-existent month', { month_id: 99999 }],
+    ['non-existent income type', { income_type_id: 99999 }],
+  ])('create income for %s fails', async (_label, overrides) => {
+    const res = await client.post('/api/v1/incomes', { ...basePayload, ...overrides });
     expect(res.status).toBe(400);
   });
 
   test('get income by id', async () => {
-    const income = await seedIncome(app, monthId, {
-      income_type_id: incomeTypeId,
-      period: periodName,
-      budget: 1000,
-    });
-    const res = await app.request(`/api/v1/incomes/${income.id}`, { headers: apiHeaders() });
-    expect(res.status).toBe(200);
-    const data = (await res.json()) as { budget: number };
-    expect(data.budget).toBe(1000);
-  });
-
-  test('get non-existent income returns 404', async () => {
-    const res = await app.request('/api/v1/incomes/99999', { headers: apiHeaders() });
-    expect(res.status).toBe(404);
+    const income = await seedSharedIncome({ budget: 1000 });
+    const res = await client.get(`/api/v1/incomes/${income.id}`);
+    await expectJson(res, 200, { budget: 1000 });
   });
 
   test('update an income', async () => {
-    const income = await seedIncome(app, monthId, {
-      income_type_id: incomeTypeId,
-      period: periodName,
-      budget: 2000,
-    });
-    const res = await app.request(`/api/v1/incomes/${income.id}`, {
-      method: 'PUT',
-      headers: apiHeaders(),
-      body: JSON.stringify({ amount: 2500 }),
-    });
-    expect(res.status).toBe(200);
-    const data = (await res.json()) as { amount: number };
-    expect(data.amount).toBe(2500);
+    const income = await seedSharedIncome({ budget: 2000 });
+    const res = await client.put(`/api/v1/incomes/${income.id}`, { amount: 2500 });
+    await expectJson(res, 200, { amount: 2500 });
   });
 
   test('delete an income', async () => {
-    const income = await seedIncome(app, monthId, {
-      income_type_id: incomeTypeId,
-      period: periodName,
-    });
-    const res = await app.request(`/api/v1/incomes/${income.id}`, {
-      method: 'DELETE',
-      headers: apiHeaders(),
-    });
+    const income = await seedSharedIncome();
+    const res = await client.delete(`/api/v1/incomes/${income.id}`);
     expect(res.status).toBe(200);
 
-    const getRes = await app.request(`/api/v1/incomes/${income.id}`, { headers: apiHeaders() });
+    const getRes = await client.get(`/api/v1/incomes/${income.id}`);
     expect(getRes.status).toBe(404);
   });
 
-  test('cannot add income to closed month', async () => {
-    const closedMonth = await seedMonth(app, 2024, 6);
-    await app.request(`/api/v1/months/${closedMonth.id}/close`, {
-      method: 'POST',
-      headers: apiHeaders(),
-    });
-
-    const res = await app.request('/api/v1/incomes', {
-      method: 'POST',
-      headers: apiHeaders(),
-      body: JSON.stringify({
-        income_type_id: incomeTypeId,
-        period: periodName,
-        month_id: closedMonth.id,
-      }),
-    });
+  test.each([
+    ['add', (_id: number, body: object) => client.post('/api/v1/incomes', body)],
+    ['update', (id: number, body: object) => client.put(`/api/v1/incomes/${id}`, body)],
+    ['delete', (id: number) => client.delete(`/api/v1/incomes/${id}`)],
+  ] as const)('cannot %s income in closed month', async (_action, send) => {
+    // Closing the shared month is undone by the per-test savepoint rollback.
+    const income = await seedSharedIncome();
+    await client.post(`/api/v1/months/${monthId}/close`);
+
+    const res = await send(income.id, basePayload);
     expect(res.status).toBe(400);
   });
 
   test('filter incomes by month_id', async () => {
-    const res = await app.request(`/api/v1/incomes?month_id=${monthId}`, { headers: apiHeaders() });
+    const otherMonth = await seedMonth(app, 2023, 6);
+    const [inMonth] = insertIncomes([
+      basePayload,
+      { ...basePayload, month_id: otherMonth.id },
+    ]);
+
+    const res = await client.get('/api/v1/incomes', { month_id: monthId });
     expect(res.status).toBe(200);
-    const data = (await res.json()) as Array<{ month_id: number }>;
-    expect(data.every((i) => i.month_id === monthId)).toBe(true);
+    const data = (await res.json()) as Array<{ id: number; month_id: number }>;
+    expect(data.map((i) => i.id)).toEqual([inMonth.id]);
   });
 });
 
 describe('Incomes (HTTP)', () => {
-  let baseUrl: string;
+  let http: ApiClient;
 
   beforeAll(async () => {
-    baseUrl = await startServer();
-  });
-
-  afterAll(async () => {
-    await stopServer();
+    http = httpApiClient(await startServer());
   });
 
   test('create and get income via HTTP', async () => {
-    const createRes = await fetch(`${baseUrl}/api/v1/incomes`, {
-      method: 'POST',
-      headers: apiHeaders(),
-      body: JSON.stringify({
-        income_type_id: incomeTypeId,
-        period: periodName,
-        budget: 3000,
-        month_id: monthId,
-      }),
-    });
+    const createRes = await http.post('/api/v1/incomes', { ...basePayload, budget: 3000 });
     expect(createRes.status).toBe(201);
     const created = (await createRes.json()) as { id: number };
 
-    const getRes = await fetch(`${baseUrl}/api/v1/incomes/${created.id}`, {
-      headers: apiHeaders(),
-    });
+    const getRes = await http.get(`/api/v1/incomes/${created.id}`);
     expect(getRes.status).toBe(200);
   });
 });
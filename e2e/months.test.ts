@@ -1,96 +1,103 @@
-import { describe, test, expect, beforeAll, afterAll } from 'bun:test';
-import { getApp, startServer, stopServer } from './setup';
-import { apiHeaders, seedMonth, seedPeriod, seedCategory, seedExpense, seedIncomeType, seedIncome } from './helpers';
+import { describe, test, expect, beforeAll } from 'bun:test';
+import { getApp, getSqlite, startServer, useSavepointIsolation } from './setup';
+import {
+  apiClient,
+  httpApiClient,
+  describeNotFound,
+  seedMonth,
+  insertExpenses,
+  insertIncomes,
+  insertIncomeType,
+  type ApiClient,
+} from './helpers';
 import type { Hono } from 'hono';
 
+const MONTH_NAMES = [
+  'January', 'February', 'March', 'April', 'May', 'June',
+  'July', 'August', 'September', 'October', 'November', 'December',
+];
+
+/** The name and date range the API derives for a year and month. */
+function expectedMonth(year: number, month: number) {
+  const mm = String(month).padStart(2, '0');
+  // Day 0 of the following month is the last day of this one.
+  const lastDay = new Date(year, month, 0).getDate();
+  return {
+    year,
+    month,
+    name: `${MONTH_NAMES[month - 1]} ${year}`,
+    start_date: `${year}-${mm}-01`,
+    end_date: `${year}-${mm}-${lastDay}`,
+  };
+}
+
 let app: Hono;
+let client: ApiClient;
+// Seeded once for the file; per-test changes to it are rolled back.
+let sharedMonth: { id: number };
 
 beforeAll(async () => {
   app = await getApp();
+  client = apiClient(app);
+  sharedMonth = await seedMonth(app, 2025, 7);
 });
 
+useSavepointIsolation();
+
 describe('Months (Hono client)', () => {
+  describeNotFound('months', () => client, { name: 'x' }, ['close', 'open', 'clone']);
+
   test('list months', async () => {
-    const res = await app.request('/api/v1/months', { headers: apiHeaders() });
+    const res = await client.get('/api/v1/months');
     expect(res.status).toBe(200);
-    const data = (await res.json()) as unknown[];
-    expect(Array.isArray(data)).toBe(true);
+    const data = (await res.json()) as Array<{ id: number }>;
+    expect(data.map((m) => m.id)).toContain(sharedMonth.id);
   });
 
-  test('create a month', async () => {
-    const res = await app.request('/api/v1/months', {
-      method: 'POST',
-      headers: apiHeaders(),
-      body: JSON.stringify({ year: 2025, month: 6 }),
-    });
+  test.each([
+    [2025, 6],
+    [2024, 2],
+    [2024, 12],
+  ])('create month %i-%i derives its name and dates', async (year, month) => {
+    const res = await client.post('/api/v1/months', { year, month });
     expect(res.status).toBe(201);
-    const data = (await res.json()) as { id: number; name: string; year: number; month: number; start_date: string; end_date: string };
-    expect(data.name).toBe('June 2025');
-    expect(data.year).toBe(2025);
-    expect(data.month).toBe(6);
-    expect(data.start_date).toBe('2025-06-01');
-    expect(data.end_date).toBe('2025-06-30');
+    expect(await res.json()).toMatchObject(expectedMonth(year, month));
   });
 
   test('create duplicate month fails (409)', async () => {
-    const res = await app.request('/api/v1/months', {
-      method: 'POST',
-      headers: apiHeaders(),
-      body: JSON.stringify({ year: 2025, month: 6 }),
-    });
+    const res = await client.post('/api/v1/months', { year: 2025, month: 7 });
     expect(res.status).toBe(409);
   });
 
   test('get month by id', async () => {
-    const month = await seedMonth(app, 2025, 7);
-    const res = await app.request(`/api/v1/months/${month.id}`, { headers: apiHeaders() });
+    const res = await client.get(`/api/v1/months/${sharedMonth.id}`);
     expect(res.status).toBe(200);
-    const data = (await res.json()) as { name: string };
-    expect(data.name).toBe('July 2025');
-  });
-
-  test('get non-existent month returns 404', async () => {
-    const res = await app.request('/api/v1/months/99999', { headers: apiHeaders() });
-    expect(res.status).toBe(404);
+    expect(await res.json()).toMatchObject(expectedMonth(2025, 7));
   });
 
   test('update a month', async () => {
-    const month = await seedMonth(app, 2025, 8);
-    const res = await app.request(`/api/v1/months/${month.id}`, {
-      method: 'PUT',
-      headers: apiHeaders(),
-      body: JSON.stringify({ year: 2025, month: 9 }),
-    });
+    const res = await client.put(`/api/v1/months/${sharedMonth.id}`, { year: 2025, month: 9 });
     expect(res.status).toBe(200);
-    const data = (await res.json()) as { name: string; month: number };
-    expect(data.name).toBe('September 2025');
-    expect(data.month).toBe(9);
+    expect(await res.json()).toMatchObject(expectedMonth(2025, 9));
   });
 
   test('delete a month cascades expenses and incomes', async () => {
-    const month = await seedMonth(app, 2025, 10);
-    const period = await seedPeriod(app, 'MonthDel-Period');
-    const cat = await seedCategory(app, 'MonthDel-Cat');
-    const it = await seedIncomeType(app, 'MonthDel-IT');
-    await seedExpense(app, month.id, { expense_name: 'E1', period: period.name, category: cat.name });
-    await seedIncome(app, month.id, { income_type_id: it.id, period: period.name });
-
-    const res = await app.request(`/api/v1/months/${month.id}`, {
-      method: 'DELETE',
-      headers: apiHeaders(),
-    });
+    // Dependent rows only need to exist: write them in one transaction
+    getSqlite().transaction(() => {
+      const it = insertIncomeType('MonthDel-IT');
+      insertExpenses(sharedMonth.id, [{ expense_name: 'E1' }]);
+      insertIncomes([{ month_id: sharedMonth.id, income_type_id: it.id }]);
+    })();
+
+    const res = await client.delete(`/api/v1/months/${sharedMonth.id}`);
     expect(res.status).toBe(200);
 
-    const getRes = await app.request(`/api/v1/months/${month.id}`, { headers: apiHeaders() });
+    const getRes = await client.get(`/api/v1/months/${sharedMonth.id}`);
     expect(getRes.status).toBe(404);
   });
 
   test('close a month', async () => {
-    const month = await seedMonth(app, 2025, 11);
-    const res = await app.request(`/api/v1/months/${month.id}/close`, {
-      method: 'POST',
-      headers: apiHeaders(),
-    });
+    const res = await client.post(`/api/v1/months/${sharedMonth.id}/close`);
     expect(res.status).toBe(200);
     const data = (await res.json()) as { is_closed: boolean; message: string };
     expect(data.is_closed).toBe(true);
@@ -98,24 +105,16 @@ describe('Months (Hono client)', () => {
   });
 
   test('close already-closed month fails', async () => {
-    const month = await seedMonth(app, 2024, 1);
-    await app.request(`/api/v1/months/${month.id}/close`, { method: 'POST', headers: apiHeaders() });
+    await client.post(`/api/v1/months/${sharedMonth.id}/close`);
 
-    const res = await app.request(`/api/v1/months/${month.id}/close`, {
-      method: 'POST',
-      headers: apiHeaders(),
-    });
+    const res = await client.post(`/api/v1/months/${sharedMonth.id}/close`);
     expect(res.status).toBe(400);
   });
 
   test('open a closed month', async () => {
-    const month = await seedMonth(app, 2024, 2);
-    await app.request(`/api/v1/months/${month.id}/close`, { method: 'POST', headers: apiHeaders() });
+    await client.post(`/api/v1/months/${sharedMonth.id}/close`);
 
-    const res = await app.request(`/api/v1/months/${month.id}/open`, {
-      method: 'POST',
-      headers: apiHeaders(),
-    });
+    const res = await client.post(`/api/v1/months/${sharedMonth.id}/open`);
     expect(res.status).toBe(200);
     const data = (await res.json()) as { is_closed: boolean; message: string };
     expect(data.is_closed).toBe(false);
@@ -123,62 +122,49 @@ describe('Months (Hono client)', () => {
   });
 
   test('open a non-closed month fails', async () => {
-    const month = await seedMonth(app, 2024, 3);
-    const res = await app.request(`/api/v1/months/${month.id}/open`, {
-      method: 'POST',
-      headers: apiHeaders(),
-    });
+    const res = await client.post(`/api/v1/months/${sharedMonth.id}/open`);
     expect(res.status).toBe(400);
   });
 
   test('clone a month', async () => {
-    const month = await seedMonth(app, 2024, 4);
-    const period = await seedPeriod(app, 'Clone-Period');
-    const cat = await seedCategory(app, 'Clone-Cat');
-    const it = await seedIncomeType(app, 'Clone-IT');
-    await seedExpense(app, month.id, { expense_name: 'CloneExp', period: period.name, category: cat.name, budget: 500 });
-    await seedIncome(app, month.id, { income_type_id: it.id, period: period.name, budget: 3000 });
-
-    const res = await app.request(`/api/v1/months/${month.id}/clone`, {
-      method: 'POST',
-      headers: apiHeaders(),
-    });
+    getSqlite().transaction(() => {
+      const it = insertIncomeType('Clone-IT');
+      insertExpenses(sharedMonth.id, [{ expense_name: 'CloneExp', budget: 500 }]);
+      insertIncomes([{ month_id: sharedMonth.id, income_type_id: it.id, budget: 3000 }]);
+    })();
+
+    const res = await client.post(`/api/v1/months/${sharedMonth.id}/clone`);
     expect(res.status).toBe(200);
     const data = (await res.json()) as { cloned_count: number; cloned_income_count: number; next_month_name: string };
     expect(data.cloned_count).toBe(1);
     expect(data.cloned_income_count).toBe(1);
-    expect(data.next_month_name).toBe('May 2024');
+    expect(data.next_month_name).toBe(expectedMonth(2025, 8).name);
   });
 
   test('get current month', async () => {
-    const res = await app.request('/api/v1/months/current', { headers: apiHeaders() });
-    // Should return 200 if any month exists, 404 if empty
-    expect([200, 404]).toContain(res.status);
+    const today = new Date();
+    await seedMonth(app, today.getFullYear(), today.getMonth() + 1);
+
+    const res = await client.get('/api/v1/months/current');
+    expect(res.status).toBe(200);
+    expect(await res.json()).toMatchObject(expectedMonth(today.getFullYear(), today.getMonth() + 1));
   });
 });
 
 describe('Months (HTTP)', () => {
-  let baseUrl: string;
+  let http: ApiClient;
 
   beforeAll(async () => {
-    baseUrl = await startServer();
-  });
-
-  afterAll(async () => {
-    await stopServer();
+    http = httpApiClient(await startServer());
   });
 
   test('create and list months via HTTP', async () => {
-    const createRes = await fetch(`${baseUrl}/api/v1/months`, {
-      method: 'POST',
-      headers: apiHeaders(),
-      body: JSON.stringify({ year: 2026, month: 1 }),
-    });
+    const createRes = await http.post('/api/v1/months', { year: 2026, month: 1 });
     expect(createRes.status).toBe(201);
 
-    const listRes = await fetch(`${baseUrl}/api/v1/months`, { headers: apiHeaders() });
+    const listRes = await http.get('/api/v1/months');
     expect(listRes.status).toBe(200);
     const data = (await listRes.json()) as Array<{ name: string }>;
-    expect(data.some((m) => m.name === 'January 2026')).toBe(true);
+    expect(data.map((m) => m.name)).toContain('January 2026');
   });
 });
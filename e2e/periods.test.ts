@@ -1,73 +1,64 @@
-import { describe, test, expect, beforeAll, afterAll } from 'bun:test';
-import { getApp, startServer, stopServer } from './setup';
-import { apiHeaders, seedPeriod, seedMonth, seedExpense, seedCategory } from './helpers';
+import { describe, test, expect, beforeAll } from 'bun:test';
+import { getApp, startServer, useSavepointIsolation } from './setup';
+import {
+  apiClient,
+  httpApiClient,
+  describeNotFound,
+  expectJson,
+  seedPeriod,
+  seedMonth,
+  seedExpense,
+  seedCategory,
+  type ApiClient,
+} from './helpers';
 import type { Hono } from 'hono';
 
 let app: Hono;
+let client: ApiClient;
 
 beforeAll(async () => {
   app = await getApp();
+  client = apiClient(app);
 });
 
+useSavepointIsolation();
+
 describe('Periods (Hono client)', () => {
+  describeNotFound('periods', () => client, { name: 'x' });
+
   test('list periods', async () => {
-    const res = await app.request('/api/v1/periods', { headers: apiHeaders() });
+    const res = await client.get('/api/v1/periods');
     expect(res.status).toBe(200);
     const data = (await res.json()) as unknown[];
     expect(Array.isArray(data)).toBe(true);
   });
 
   test('create a period', async () => {
-    const res = await app.request('/api/v1/periods', {
-      method: 'POST',
-      headers: apiHeaders(),
-      body: JSON.stringify({ name: 'Monthly', color: '#ff0000' }),
-    });
-    expect(res.status).toBe(201);
-    const data = (await res.json()) as { id: number; name: string };
-    expect(data.name).toBe('Monthly');
+    const res = await client.post('/api/v1/periods', { name: 'Monthly', color: '#ff0000' });
+    await expectJson(res, 201, { name: 'Monthly' });
   });
 
   test('create duplicate period fails', async () => {
-    const res = await app.request('/api/v1/periods', {
-      method: 'POST',
-      headers: apiHeaders(),
-      body: JSON.stringify({ name: 'Monthly' }),
-    });
+    await seedPeriod(app, 'Monthly');
+    const res = await client.post('/api/v1/periods', { name: 'Monthly' });
     expect(res.status).toBe(400);
   });
 
   test('get period by id', async () => {
     const period = await seedPeriod(app, 'Weekly');
-    const res = await app.request(`/api/v1/periods/${period.id}`, { headers: apiHeaders() });
-    expect(res.status).toBe(200);
-    const data = (await res.json()) as { name: string };
-    expect(data.name).toBe('Weekly');
-  });
-
-  test('get non-existent period returns 404', async () => {
-    const res = await app.request('/api/v1/periods/99999', { headers: apiHeaders() });
-    expect(res.status).toBe(404);
+    const res = await client.get(`/api/v1/periods/${period.id}`);
+    await expectJson(res, 200, { name: 'Weekly' });
   });
 
   test('update a period', async () => {
     const period = await seedPeriod(app, 'Bi-Weekly');
-    const res = await app.request(`/api/v1/periods/${period.id}`, {
-      method: 'PUT',
-      headers: apiHeaders(),
-      body: JSON.stringify({ name: 'Biweekly', color: '#abc' }),
-    });
-    expect(res.status).toBe(200);
-    const data = (await res.json()) as { name: string };
-    expect(data.name).toBe('Biweekly');
+    const res = await client.put(`/api/v1/periods/${period.id}`, { name: 'Biweekly', color: '#abc' });
+    await expectJson(res, 200, { name: 'Biweekly' });
   });
 
   test('delete a period with no dependencies', async () => {
     const period = await seedPeriod(app, 'ToDeletePeriod');
-    const res = await app.request(`/api/v1/periods/${period.id}`, {
-      method: 'DELETE',
-      headers: apiHeaders(),
-    });
+    const res = await client.delete(`/api/v1/periods/${period.id}`);
     expect(res.status).toBe(200);
   });
 
@@ -81,36 +72,25 @@ describe('Periods (Hono client)', () => {
       category: cat.name,
     });
 
-    const res = await app.request(`/api/v1/periods/${period.id}`, {
-      method: 'DELETE',
-      headers: apiHeaders(),
-    });
+    const res = await client.delete(`/api/v1/periods/${period.id}`);
     expect(res.status).toBe(409);
   });
 });
 
 describe('Periods (HTTP)', () => {
-  let baseUrl: string;
+  let http: ApiClient;
 
   beforeAll(async () => {
-    baseUrl = await startServer();
-  });
-
-  afterAll(async () => {
-    await stopServer();
+    http = httpApiClient(await startServer());
   });
 
   test('create and list periods via HTTP', async () => {
-    const createRes = await fetch(`${baseUrl}/api/v1/periods`, {
-      method: 'POST',
-      headers: apiHeaders(),
-      body: JSON.stringify({ name: 'HTTP-Period' }),
-    });
+    const createRes = await http.post('/api/v1/periods', { name: 'HTTP-Period' });
     expect(createRes.status).toBe(201);
 
-    const listRes = await fetch(`${baseUrl}/api/v1/periods`, { headers: apiHeaders() });
+    const listRes = await http.get('/api/v1/periods');
     expect(listRes.status).toBe(200);
     const data = (await listRes.json()) as Array<{ name: string }>;
-    expect(data.some((p) => p.name === 'HTTP-Period')).toBe(true);
+    expect(data.map((p) => p.name)).toContain('HTTP-Period');
   });
 });
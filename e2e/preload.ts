@@ -4,11 +4,24 @@
  * before any test file or backend module is imported.
  */
 
+import { afterAll } from 'bun:test';
 import { Database } from 'bun:sqlite';
-import { resolve } from 'path';
-import { existsSync, unlinkSync } from 'fs';
-
-const TEST_DB_PATH = resolve(import.meta.dir, 'test.db');
+import { join } from 'path';
+import { copyFileSync, existsSync, mkdirSync, readFileSync, renameSync, rmSync, unlinkSync } from 'fs';
+import { createHash } from 'crypto';
+import { tmpdir } from 'os';
+import { applyMigrations, migrationsFolder } from '../backend/src/db/migrate';
+
+// Keep the test DB (and the backups dir the backup service puts next to it)
+// on a RAM-backed filesystem where one is available, so commits and VACUUMs
+// never touch the disk. Falls back to the OS temp dir elsewhere (e.g. macOS).
+// The directory is per process so several `bun test` runs can go in parallel.
+const TEST_DB_DIR = join(
+  existsSync('/dev/shm') ? '/dev/shm' : tmpdir(),
+  `appz-budget-e2e-${process.pid}`,
+);
+mkdirSync(TEST_DB_DIR, { recursive: true });
+const TEST_DB_PATH = join(TEST_DB_DIR, 'test.db');
 
 // ─── Set env vars BEFORE any backend code loads ─────────────────────────────
 
@@ -16,128 +29,66 @@ process.env.DATABASE_PATH = TEST_DB_PATH;
 process.env.API_KEY = 'test-api-key';
 process.env.JWT_SECRET_KEY = 'test-jwt-secret';
 process.env.ENV = 'test';
+// Minimum bcrypt cost: tests register and log in constantly, and hash
+// strength is irrelevant here.
+process.env.BCRYPT_COST = '4';
+// The test DB is recreated every run, so skip fsync on commit.
+process.env.SQLITE_SYNCHRONOUS = 'OFF';
 
-// ─── Create DB if it doesn't exist (idempotent) ────────────────────────────
+// ─── Create a fresh DB ──────────────────────────────────────────────────────
 
 // Remove stale DB from previous run
 try { unlinkSync(TEST_DB_PATH); } catch { /* ignore */ }
 try { unlinkSync(TEST_DB_PATH + '-wal'); } catch { /* ignore */ }
 try { unlinkSync(TEST_DB_PATH + '-shm'); } catch { /* ignore */ }
 
-const sqlite = new Database(TEST_DB_PATH);
-sqlite.exec('PRAGMA journal_mode = WAL');
-sqlite.exec('PRAGMA foreign_keys = ON');
-
-const CREATE_TABLES_SQL = `
-CREATE TABLE IF NOT EXISTS users (
-  id INTEGER PRIMARY KEY AUTOINCREMENT,
-  email TEXT NOT NULL UNIQUE,
-  hashed_password TEXT NOT NULL,
-  full_name TEXT,
-  is_active INTEGER DEFAULT 1,
-  is_admin INTEGER DEFAULT 0,
-  created_at TEXT,
-  updated_at TEXT,
-  created_by TEXT,
-  updated_by TEXT
-);
-
-CREATE TABLE IF NOT EXISTS password_reset_tokens (
-  id INTEGER PRIMARY KEY AUTOINCREMENT,
-  user_id INTEGER NOT NULL,
-  token TEXT NOT NULL UNIQUE,
-  short_code TEXT,
-  expires_at TEXT NOT NULL,
-  used INTEGER DEFAULT 0,
-  created_at TEXT
-);
-
-CREATE TABLE IF NOT EXISTS categories (
-  id INTEGER PRIMARY KEY AUTOINCREMENT,
-  name TEXT NOT NULL UNIQUE,
-  color TEXT NOT NULL DEFAULT '#8b5cf6',
-  created_at TEXT,
-  updated_at TEXT,
-  created_by TEXT,
-  updated_by TEXT
-);
-
-CREATE TABLE IF NOT EXISTS periods (
-  id INTEGER PRIMARY KEY AUTOINCREMENT,
-  name TEXT NOT NULL UNIQUE,
-  color TEXT NOT NULL DEFAULT '#8b5cf6',
-  created_at TEXT,
-  updated_at TEXT,
-  created_by TEXT,
-  updated_by TEXT
-);
-
-CREATE TABLE IF NOT EXISTS income_types (
-  id INTEGER PRIMARY KEY AUTOINCREMENT,
-  name TEXT NOT NULL UNIQUE,
-  color TEXT NOT NULL DEFAULT '#10b981',
-  created_at TEXT,
-  updated_at TEXT,
-  created_by TEXT,
-  updated_by TEXT
+// Opt-in for local iteration (E2E_SCHEMA_CACHE=1): keep a built template DB in
+// the temp dir, keyed by the migration contents, and copy it instead of
+// re-running the migrations. CI leaves this off and always builds from scratch.
+const journal = JSON.parse(
+  readFileSync(join(migrationsFolder, 'meta/_journal.json'), 'utf-8'),
+) as { entries: Array<{ tag: string }> };
+const migrations = journal.entries.map(({ tag }) =>
+  readFileSync(join(migrationsFolder, `${tag}.sql`), 'utf-8'),
 );
+const migrationsHash = createHash('sha256').update(migrations.join('\n')).digest('hex');
+const SCHEMA_CACHE_PATH =
+  process.env.E2E_SCHEMA_CACHE === '1'
+    ? join(tmpdir(), `appz-budget-e2e-schema-${migrationsHash.slice(0, 16)}.db`)
+    : null;
+
+// Build the schema with the backend's own migration runner (db/migrate.ts),
+// the same code path production uses. It also records the applied migrations,
+// so the backend's startup migrate() finds nothing left to do.
+function createSchema(): void {
+  const sqlite = new Database(TEST_DB_PATH);
+  sqlite.exec('PRAGMA journal_mode = WAL');
+  sqlite.exec('PRAGMA foreign_keys = ON');
+  applyMigrations(sqlite);
+
+  if (SCHEMA_CACHE_PATH) {
+    // Write under a per-process name and rename, so parallel runs never see
+    // (or collide on) a half-written template.
+    const pending = `${SCHEMA_CACHE_PATH}.${process.pid}`;
+    sqlite.exec(`VACUUM INTO '${pending}'`);
+    renameSync(pending, SCHEMA_CACHE_PATH);
+  }
+  sqlite.close();
+}
 
-CREATE TABLE IF NOT EXISTS months (
-  id INTEGER PRIMARY KEY AUTOINCREMENT,
-  year INTEGER NOT NULL,
-  month INTEGER NOT NULL,
-  name TEXT NOT NULL UNIQUE,
-  start_date TEXT NOT NULL,
-  end_date TEXT NOT NULL,
-  is_closed INTEGER DEFAULT 0,
-  closed_at TEXT,
-  closed_by TEXT,
-  created_at TEXT,
-  updated_at TEXT,
-  created_by TEXT,
-  updated_by TEXT
-);
-
-CREATE TABLE IF NOT EXISTS expenses (
-  id INTEGER PRIMARY KEY AUTOINCREMENT,
-  expense_name TEXT NOT NULL,
-  period TEXT NOT NULL,
-  category TEXT NOT NULL,
-  budget REAL DEFAULT 0,
-  cost REAL DEFAULT 0,
-  notes TEXT,
-  month_id INTEGER NOT NULL REFERENCES months(id),
-  "order" INTEGER DEFAULT 0,
-  purchases TEXT,
-  expense_date TEXT,
-  created_at TEXT,
-  updated_at TEXT,
-  created_by TEXT,
-  updated_by TEXT
-);
-
-CREATE TABLE IF NOT EXISTS incomes (
-  id INTEGER PRIMARY KEY AUTOINCREMENT,
-  income_type_id INTEGER NOT NULL REFERENCES income_types(id),
-  period TEXT NOT NULL,
-  budget REAL DEFAULT 0,
-  amount REAL DEFAULT 0,
-  month_id INTEGER NOT NULL REFERENCES months(id),
-  created_at TEXT,
-  updated_at TEXT,
-  created_by TEXT,
-  updated_by TEXT
-);
-
-CREATE TABLE IF NOT EXISTS seed_records (
-  id INTEGER PRIMARY KEY AUTOINCREMENT,
-  seed_id TEXT NOT NULL UNIQUE,
-  executed_at TEXT NOT NULL
-);
-`;
-
-for (const statement of CREATE_TABLES_SQL.split(';').filter((s) => s.trim())) {
-  sqlite.exec(statement + ';');
+if (SCHEMA_CACHE_PATH && existsSync(SCHEMA_CACHE_PATH)) {
+  copyFileSync(SCHEMA_CACHE_PATH, TEST_DB_PATH);
+} else {
+  createSchema();
 }
 
-sqlite.close();
+// ─── Teardown ───────────────────────────────────────────────────────────────
+
+// Test files share one server (see startServer); stop it after the whole run.
+// setup.ts loads the backend, so it is imported only once the env is in place.
+// The per-process DB directory is removed afterwards so runs don't pile up.
+afterAll(async () => {
+  const { stopServer } = await import('./setup');
+  await stopServer();
+  rmSync(TEST_DB_DIR, { recursive: true, force: true });
+});
@@ -3,16 +3,31 @@
  *
  * NOTE: DB creation and env vars are handled by preload.ts (via bunfig.toml).
  * Do NOT create/delete the test DB in individual test files.
+ *
+ * This module imports the backend at the top level, so preload.ts must only
+ * import it lazily — otherwise the app would load before the env is set.
  */
 
+import { beforeEach, afterEach, spyOn } from 'bun:test';
+import { app } from '../backend/src/app';
+import * as connection from '../backend/src/db/connection';
+
 // ─── HTTP server lifecycle ──────────────────────────────────────────────────
 
 let server: ReturnType<typeof Bun.serve> | null = null;
 let baseUrl = '';
 type ServerFetch = Parameters<typeof Bun.serve>[0]['fetch'];
 
+/**
+ * Start the shared HTTP server, or return the URL of the one already running.
+ *
+ * Every test file in the run shares a single server; preload.ts stops it
+ * once after all files have finished.
+ */
 export async function startServer(): Promise<string> {
-  const { app } = await import('../backend/src/app');
+  if (server) {
+    return baseUrl;
+  }
 
   server = startOnAvailablePort(app.fetch);
 
@@ -56,6 +71,88 @@ export async function stopServer(): Promise<void> {
 // ─── Hono test client ───────────────────────────────────────────────────────
 
 export async function getApp() {
-  const { app } = await import('../backend/src/app');
   return app;
 }
+
+// ─── Per-test isolation ─────────────────────────────────────────────────────
+
+const TEST_SAVEPOINT = 'e2e_test';
+
+/**
+ * The backend's own sqlite connection, for direct reads and writes in tests.
+ * Prefer this over opening a second Database on the file.
+ */
+export function getSqlite() {
+  // Read through the module namespace on every call: a backup restore
+  // swaps the exported connection for a new one.
+  return connection.sqlite;
+}
+
+/**
+ * Run `fn` and return how many SQL statements the backend prepared meanwhile.
+ *
+ * Drizzle prepares one statement per query it runs, so this guards endpoints
+ * against per-row query loops. Lookups served from the prepared-statement
+ * cache (db/prepared.ts) are not prepared again and are not counted.
+ */
+export async function countQueries(fn: () => Promise<unknown>): Promise<number> {
+  const prepare = spyOn(getSqlite(), 'prepare');
+  try {
+    await fn();
+    return prepare.mock.calls.length;
+  } finally {
+    prepare.mockRestore();
+  }
+}
+
+/**
+ * Wrap every test in the calling file in a SAVEPOINT that is rolled back
+ * afterwards, so rows a test inserts never leak into the next test.
+ *
+ * Call at the top level of a test file. Data seeded in beforeAll is written
+ * outside the savepoint and stays visible to every test. Do NOT use in files
+ * that close or replace the database connection (backups).
+ */
+export function useSavepointIsolation(): void {
+  beforeEach(() => {
+    const sqlite = getSqlite();
+    sqlite.exec(`SAVEPOINT ${TEST_SAVEPOINT}`);
+  });
+
+  afterEach(() => {
+    const sqlite = getSqlite();
+    sqlite.exec(`ROLLBACK TO ${TEST_SAVEPOINT}`);
+    sqlite.exec(`RELEASE ${TEST_SAVEPOINT}`);
+  });
+}
+
+// ─── Table reset ────────────────────────────────────────────────────────────
+
+// Children before parents so foreign keys never block a delete.
+const DATA_TABLES = [
+  'expenses',
+  'incomes',
+  'password_reset_tokens',
+  'months',
+  'categories',
+  'periods',
+  'income_types',
+  'users',
+  'seed_records',
+];
+
+/**
+ * Empty every data table and reset AUTOINCREMENT counters, keeping the schema
+ * (and the drizzle migration journal) in place — much cheaper than rebuilding
+ * the database. For files that cannot use savepoint isolation (backups) and
+ * would otherwise leave their state to whichever file runs next.
+ */
+export function resetDatabase(): void {
+  const sqlite = getSqlite();
+  sqlite.transaction(() => {
+    for (const table of DATA_TABLES) {
+      sqlite.exec(`DELETE FROM ${table}`);
+    }
+    sqlite.exec('DELETE FROM sqlite_sequence');
+  })();
+}
@@ -1,72 +1,132 @@
-import { describe, test, expect, beforeAll, afterAll } from 'bun:test';
-import { getApp, startServer, stopServer } from './setup';
-import { apiHeaders, seedMonth, seedPeriod, seedCategory, seedExpense, seedIncomeType, seedIncome } from './helpers';
+import { describe, test, expect, beforeAll } from 'bun:test';
+import { countQueries, getApp, getSqlite, startServer, useSavepointIsolation } from './setup';
+import {
+  apiClient,
+  httpApiClient,
+  seedFixtures,
+  seedMonth,
+  insertExpenses,
+  insertIncomes,
+  type ApiClient,
+} from './helpers';
 import type { Hono } from 'hono';
 
 let app: Hono;
+let client: ApiClient;
 let monthId: number;
+let otherMonthId: number;
+let periodName: string;
 
 beforeAll(async () => {
   app = await getApp();
+  client = apiClient(app);
 
-  const period = await seedPeriod(app, 'Sum-Period');
-  const cat = await seedCategory(app, 'Sum-Category');
-  const it = await seedIncomeType(app, 'Sum-Salary');
-  const month = await seedMonth(app, 2023, 3);
+  const [{ period, category: cat, incomeType: it, month }, otherMonth] = await Promise.all([
+    seedFixtures(app, 'Sum', 2023, 3),
+    seedMonth(app, 2023, 4),
+  ]);
   monthId = month.id;
-
-  await seedExpense(app, monthId, { expense_name: 'Rent', period: period.name, category: cat.name, budget: 1500, cost: 1500 });
-  await seedExpense(app, monthId, { expense_name: 'Food', period: period.name, category: cat.name, budget: 500, cost: 400 });
-  await seedIncome(app, monthId, { income_type_id: it.id, period: period.name, budget: 5000, amount: 5200 });
+  otherMonthId = otherMonth.id;
+  periodName = period.name;
+
+  // One dataset for every test: two months in the same period, so the
+  // month and period filters each select a different slice. The summary
+  // endpoints only read these rows: write them in one transaction.
+  getSqlite().transaction(() => {
+    const shared = { period: period.name, category: cat.name };
+    insertExpenses(
+      monthId,
+      [
+        { expense_name: 'Rent', budget: 1500, cost: 1500 },
+        { expense_name: 'Food', budget: 500, cost: 400 },
+      ],
+      shared,
+    );
+    insertExpenses(otherMonthId, [{ expense_name: 'Rent', budget: 1500, cost: 1600 }], shared);
+    insertIncomes(
+      [
+        { month_id: monthId, income_type_id: it.id, budget: 5000, amount: 5200 },
+        { month_id: otherMonthId, income_type_id: it.id, budget: 5000, amount: 5000 },
+      ],
+      { period: period.name },
+    );
+  })();
 });
 
+// The tests only read, but a rollback keeps any stray write from leaking
+// into the shared fixtures the totals assertions depend on.
+useSavepointIsolation();
+
 describe('Summary (Hono client)', () => {
-  test('GET /api/v1/summary/totals', async () => {
-    const res = await app.request(`/api/v1/summary/totals?month_id=${monthId}`, {
-      headers: apiHeaders(),
-    });
+  // Filters are thunks: the ids only exist once beforeAll has seeded them.
+  test.each([
+    [
+      'month',
+      () => ({ month_id: monthId }),
+      {
+        total_budget_expenses: 2000,
+        total_current_expenses: 1900,
+        total_budget_income: 5000,
+        total_current_income: 5200,
+        total_budget: 3000,
+        total_current: 3300,
+      },
+    ],
+    [
+      'period',
+      () => ({ period: periodName }),
+      {
+        total_budget_expenses: 3500,
+        total_current_expenses: 3500,
+        total_budget_income: 10000,
+        total_current_income: 10200,
+        total_budget: 6500,
+        total_current: 6700,
+      },
+    ],
+    [
+      'month and period',
+      () => ({ month_id: otherMonthId, period: periodName }),
+      {
+        total_budget_expenses: 1500,
+        total_current_expenses: 1600,
+        total_budget_income: 5000,
+        total_current_income: 5000,
+        total_budget: 3500,
+        total_current: 3400,
+      },
+    ],
+  ] as const)('GET /api/v1/summary/totals filtered by %s', async (_filter, query, expected) => {
+    const res = await client.get('/api/v1/summary/totals', query());
     expect(res.status).toBe(200);
-    const data = (await res.json()) as {
-      total_budget_expenses: number;
-      total_current_expenses: number;
-      total_budget_income: number;
-      total_current_income: number;
-      total_budget: number;
-      total_current: number;
-    };
-    expect(data.total_budget_expenses).toBe(2000);
-    expect(data.total_current_expenses).toBe(1900);
-    expect(data.total_budget_income).toBe(5000);
-    expect(data.total_current_income).toBe(5200);
-    expect(data.total_budget).toBe(3000);
-    expect(data.total_current).toBe(3300);
+    expect(await res.json()).toEqual(expected);
   });
 
   test('GET /api/v1/summary/totals without filters', async () => {
-    const res = await app.request('/api/v1/summary/totals', { headers: apiHeaders() });
+    const res = await client.get('/api/v1/summary/totals');
     expect(res.status).toBe(200);
     const data = (await res.json()) as { total_budget_expenses: number };
     expect(typeof data.total_budget_expenses).toBe('number');
   });
 
   test('GET /api/v1/summary/by-period', async () => {
-    const res = await app.request(`/api/v1/summary/by-period?month_id=${monthId}`, {
-      headers: apiHeaders(),
-    });
+    const res = await client.get('/api/v1/summary/by-period', { month_id: monthId });
     expect(res.status).toBe(200);
     const data = (await res.json()) as {
       periods: Array<{ period: string; total_income: number; total_expenses: number }>;
       grand_total_income: number;
       grand_total_expenses: number;
     };
-    expect(Array.isArray(data.periods)).toBe(true);
-    expect(typeof data.grand_total_income).toBe('number');
+    expect(data.periods.find((p) => p.period === periodName)).toMatchObject({
+      total_income: 5200,
+      total_expenses: 1900,
+    });
+    expect(data.grand_total_income).toBe(5200);
+    expect(data.grand_total_expenses).toBe(1900);
   });
 
   test('GET /api/v1/summary/expenses-by-period', async () => {
-    const res = await app.request(`/api/v1/summary/expenses-by-period?month_id=${monthId}`, {
-      headers: apiHeaders(),
-    });
+    const res = await client.get('/api/v1/summary/expenses-by-period', { month_id: monthId });
     expect(res.status).toBe(200);
     const data = (await res.json()) as Array<{
       period: string;
@@ -74,13 +134,15 @@ describe('Summary (Hono client)', () => {
       total: number;
       over_budget: boolean;
     }>;
-    expect(Array.isArray(data)).toBe(true);
+    expect(data.find((p) => p.period === periodName)).toMatchObject({
+      budget: 2000,
+      total: 1900,
+      over_budget: false,
+    });
   });
 
   test('GET /api/v1/summary/monthly-trends', async () => {
-    const res = await app.request('/api/v1/summary/monthly-trends?num_months=6', {
-      headers: apiHeaders(),
-    });
+    const res = await client.get('/api/v1/summary/monthly-trends', { num_months: 6 });
     expect(res.status).toBe(200);
     const data = (await res.json()) as {
       months: Array<{ month_name: string; total_income: number; total_expenses: number }>;
@@ -93,9 +155,7 @@ describe('Summary (Hono client)', () => {
   });
 
   test('GET /api/v1/summary/insights', async () => {
-    const res = await app.request(`/api/v1/summary/insights?month_id=${monthId}`, {
-      headers: apiHeaders(),
-    });
+    const res = await client.get('/api/v1/summary/insights', { month_id: monthId });
     expect(res.status).toBe(200);
     const data = (await res.json()) as {
       insights: Array<{ type: string; icon: string; message: string }>;
@@ -110,36 +170,41 @@ describe('Summary (Hono client)', () => {
     expect(data.total_categories).toBeGreaterThan(0);
   });
 
+  test.each([
+    // one SUM() per table
+    ['/api/v1/summary/totals', 2],
+    // periods + one grouped aggregate per table
+    ['/api/v1/summary/by-period', 3],
+    ['/api/v1/summary/expenses-by-period', 2],
+    // months + categories + one batched fetch per table
+    ['/api/v1/summary/monthly-trends?num_months=24', 4],
+  ])('%s runs a fixed number of queries', async (path, expected) => {
+    const queries = await countQueries(() => client.get(path));
+    expect(queries).toBe(expected);
+  });
+
   test('GET /api/v1/summary/insights without month returns default', async () => {
-    const res = await app.request('/api/v1/summary/insights', { headers: apiHeaders() });
+    const res = await client.get('/api/v1/summary/insights');
     expect(res.status).toBe(200);
   });
 });
 
 describe('Summary (HTTP)', () => {
-  let baseUrl: string;
+  let http: ApiClient;
 
   beforeAll(async () => {
-    baseUrl = await startServer();
-  });
-
-  afterAll(async () => {
-    await stopServer();
+    http = httpApiClient(await startServer());
   });
 
   test('GET totals via HTTP', async () => {
-    const res = await fetch(`${baseUrl}/api/v1/summary/totals?month_id=${monthId}`, {
-      headers: apiHeaders(),
-    });
+    const res = await http.get('/api/v1/summary/totals', { month_id: monthId });
     expect(res.status).toBe(200);
     const data = (await res.json()) as { total_current_expenses: number };
     expect(typeof data.total_current_expenses).toBe('number');
   });
 
   test('GET insights via HTTP', async () => {
-    const res = await fetch(`${baseUrl}/api/v1/summary/insights`, {
-      headers: apiHeaders(),
-    });
+    const res = await http.get('/api/v1/summary/insights');
     expect(res.status).toBe(200);
   });
 });